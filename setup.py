@@ -44,6 +44,7 @@ setup(
     zip_safe=False,
     entry_points={
         "sqlalchemy.dialects": [
+            "access = sqlalchemy_access.pyodbc:AccessDialect_pyodbc",
             "access.pyodbc = sqlalchemy_access.pyodbc:AccessDialect_pyodbc",
         ]
     },
@@ -12,17 +12,29 @@ from .base import (
     LongInteger,
     LongText,
     OleObject,
+    QueryTimeoutError,
     ReplicationID,
     ShortText,
     Single,
     YesNo,
 )
+from .dml import merge
+from .ext import crosstab
+
+try:
+    from . import migration  # noqa: F401 - registers the Alembic impl
+except ImportError:
+    # Alembic is not installed
+    pass
 
 import pyodbc
 
 __version__ = "2.0.4.dev0"
 
 pyodbc.pooling = False  # required for Access databases with ODBC linked tables
+_registry.register(
+    "access", "sqlalchemy_access.pyodbc", "AccessDialect_pyodbc"
+)
 _registry.register(
     "access.pyodbc", "sqlalchemy_access.pyodbc", "AccessDialect_pyodbc"
 )
@@ -11,11 +11,29 @@ Support for the Microsoft Access database.
 
 
 """
+import contextlib
+import io
+import itertools
+import uuid
+from uuid import UUID as _python_UUID
+
 import pyodbc
-from sqlalchemy import types, exc, pool
-from sqlalchemy.sql import compiler
+from sqlalchemy import types, exc, pool, select, util
+from sqlalchemy import schema as sa_schema
+from sqlalchemy.sql import base as sql_base
+from sqlalchemy.sql import compiler, elements, functions, operators
+from sqlalchemy.sql import selectable
+from sqlalchemy.sql import util as sql_util
 from sqlalchemy.engine import default, reflection
-import win32com.client
+
+try:
+    import win32com.client
+except ImportError:  # pywin32 is only available on Windows
+    win32com = None
+
+from .batch import batch_statements
+from .cache import _CachingCursor
+from .ddl import AlterCounter
 
 
 # AutoNumber
@@ -54,23 +72,213 @@ Integer = types.SMALLINT
 LongInteger = types.INTEGER
 
 
-class LONGCHAR(types.Text):
+# DAO constants
+dbMemo = 12
+dbOpenDynaset = 2
+dbOpenSnapshot = 4
+
+
+class _DAOChunkStream(io.IOBase):
+    """
+    File-like access to a single LONGCHAR or OLEOBJECT value via DAO
+    Field.GetChunk (reading) and Field.AppendChunk (writing), so large values
+    can be copied to and from disk without holding the whole value in memory.
+    """
+
+    def __init__(self, db, recordset, field_name, mode, chunk_size):
+        self._db = db
+        self._recordset = recordset
+        self._field = recordset.Fields(field_name)
+        self._mode = mode
+        self._cancelled = False
+        self._offset = 0
+        self._empty = "" if self._field.Type == dbMemo else b""
+        self.chunk_size = chunk_size
+        if mode == "r":
+            self._size = self._field.FieldSize()
+        else:
+            # AppendChunk appends to the current value, so start from Null
+            self._recordset.Edit()
+            self._field.Value = None
+
+    def readable(self):
+        return self._mode == "r"
+
+    def writable(self):
+        return self._mode == "w"
+
+    def read(self, size=-1):
+        if not self.readable():
+            raise io.UnsupportedOperation("stream was not opened for reading")
+        remaining = self._size - self._offset
+        if size is None or size < 0:
+            size = remaining
+        size = min(size, remaining)
+        if size <= 0:
+            return self._empty
+        chunk = self._field.GetChunk(self._offset, size)
+        self._offset += size
+        if chunk is None:
+            return self._empty
+        return chunk if isinstance(chunk, str) else bytes(chunk)
+
+    def write(self, data):
+        if not self.writable():
+            raise io.UnsupportedOperation("stream was not opened for writing")
+        if data:
+            self._field.AppendChunk(data)
+        return len(data)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # don't save a partially written value
+            self._cancelled = True
+        self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._mode == "w":
+                if self._cancelled:
+                    self._recordset.CancelUpdate()
+                else:
+                    self._recordset.Update()
+        finally:
+            self._recordset.Close()
+            self._db.Close()
+            super(_DAOChunkStream, self).close()
+
+
+class _ChunkedStreamType(object):
+    """Adds chunked streaming of column values to large object types."""
+
+    default_chunk_size = 1024 * 1024
+
+    @classmethod
+    def open_stream(
+        cls, connection, column, whereclause, mode="r", chunk_size=None
+    ):
+        """
+        Open a file-like object on the value of ``column`` in the single row
+        selected by ``whereclause``. Use mode "r" to read the value in chunks
+        or mode "w" to replace it with the data written to the stream.
+
+        The stream goes through DAO, so it runs outside of the transaction
+        (if any) in progress on ``connection``. If the ``with`` block that
+        writes to the stream raises, the value is left unchanged.
+        """
+        if mode not in ("r", "w"):
+            raise ValueError("mode must be 'r' or 'w', not %r" % mode)
+        stmt = select(column).where(whereclause)
+        sql = str(
+            stmt.compile(
+                dialect=connection.dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        # a table in another database file is opened in that file
+        dialect_options = getattr(column.table, "dialect_options", None)
+        access_database = (
+            dialect_options["access"]["database"] if dialect_options else None
+        )
+        db = connection.dialect._get_dao_database(
+            connection,
+            column.table.name,
+            read_only=(mode == "r"),
+            access_database=access_database,
+        )
+        try:
+            rst = db.OpenRecordset(
+                sql, dbOpenSnapshot if mode == "r" else dbOpenDynaset
+            )
+            if rst.EOF:
+                rst.Close()
+                raise exc.NoResultFound(
+                    "No row was found for the stream's WHERE clause"
+                )
+        except Exception:
+            db.Close()
+            raise
+        return _DAOChunkStream(
+            db, rst, column.name, mode, chunk_size or cls.default_chunk_size
+        )
+
+
+class LONGCHAR(_ChunkedStreamType, types.Text):
     __visit_name__ = "LONGCHAR"
 
 
 LongText = LONGCHAR
 
 
-class OLEOBJECT(types.LargeBinary):
+class OLEOBJECT(_ChunkedStreamType, types.LargeBinary):
     __visit_name__ = "OLEOBJECT"
 
 
 OleObject = OLEOBJECT
 
 
-class GUID(types.Integer):
+class GUID(types.Uuid):
+    """
+    A ReplicationID (GUID) column.
+
+    Access ODBC returns GUID values as strings in braces, e.g.
+    ``{0F8FAD5B-D9CB-469F-A165-70867728950E}``, or as uuid.UUID objects if
+    ``pyodbc.native_uuid`` is set. With ``as_uuid=True`` (the default) they
+    are returned as uuid.UUID objects, otherwise as lowercase strings in the
+    standard form without braces. 16-byte binary values (little-endian GUID
+    layout) are also accepted.
+    """
+
     __visit_name__ = "GUID"
 
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return value
+            if value.__class__ is bytes:
+                value = _python_UUID(bytes_le=value)
+            elif value.__class__ is str and value[:1] == "{":
+                return value
+            return "{%s}" % value
+
+        return process
+
+    def literal_processor(self, dialect):
+        bind_process = self.bind_processor(dialect)
+
+        def process(value):
+            return "{guid %s}" % bind_process(value)
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        if self.as_uuid:
+
+            def process(value):
+                if value is None or value.__class__ is _python_UUID:
+                    return value
+                if value.__class__ is bytes:
+                    return _python_UUID(bytes_le=value)
+                # the UUID constructor strips the braces
+                return _python_UUID(value)
+
+        else:
+
+            def process(value):
+                if value is None:
+                    return value
+                if value.__class__ is str:
+                    if value[:1] == "{":
+                        value = value[1:-1]
+                    return value.lower()
+                if value.__class__ is bytes:
+                    value = _python_UUID(bytes_le=value)
+                return str(value)
+
+        return process
+
 
 ReplicationID = GUID
 ShortText = types.String
@@ -114,11 +322,99 @@ ischema_names = {
 }
 
 
+class QueryTimeoutError(exc.OperationalError):
+    """A statement did not complete within its ``timeout`` execution
+    option."""
+
+
+def _table_key(table):
+    """Identify a table for the result cache, including its database file"""
+    dialect_options = getattr(table, "dialect_options", None)
+    database = (
+        dialect_options["access"]["database"] if dialect_options else None
+    )
+    return (database, table.name.lower())
+
+
 class AccessExecutionContext(default.DefaultExecutionContext):
+    _result_cache_key = None
+
     def get_lastrowid(self):
         self.cursor.execute("SELECT @@identity AS lastrowid")
         return self.cursor.fetchone()[0]
 
+    def create_cursor(self):
+        cache = self.dialect.result_cache
+        if (
+            cache is None
+            or self.compiled is None
+            or self.executemany
+            or not getattr(self.compiled.statement, "is_select", False)
+            or self.compiled.schema_translate_map
+            or not self.execution_options.get("access_result_cache", True)
+        ):
+            return super(AccessExecutionContext, self).create_cursor()
+        # the statement and its DBAPI parameters are not final yet, so key
+        # the result by the compiled SQL and the parameter values
+        key = (
+            self.unicode_statement,
+            tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in self.compiled_parameters[0].items()
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return super(AccessExecutionContext, self).create_cursor()
+        cursor = None
+        if cache.database_path is None:
+            cursor = super(AccessExecutionContext, self).create_cursor()
+            cache.database_path = self.dialect._get_database_path(cursor)
+        cached_cursor = cache.get(key)
+        if cached_cursor is None:
+            self._result_cache_key = key
+            if cursor is None:
+                cursor = super(AccessExecutionContext, self).create_cursor()
+            return cursor
+        # serve the cached rows, without a DBAPI cursor
+        if cursor is not None:
+            cursor.close()
+        self._is_server_side = False
+        return cached_cursor
+
+    def post_exec(self):
+        cache = self.dialect.result_cache
+        if cache is None:
+            return
+        info = self.root_connection.connection.info
+        transaction = self.root_connection.get_transaction()
+        if self.cursor.description is None:
+            # the statement may have changed the database
+            if transaction is not None:
+                info["access_result_cache_dirty"] = transaction
+            if self.isinsert or self.isupdate or self.isdelete:
+                cache.invalidate([_table_key(self.compiled.statement.table)])
+            else:
+                cache.clear()
+        elif self._result_cache_key is not None and (
+            transaction is None
+            or info.get("access_result_cache_dirty") is not transaction
+        ):
+            self.cursor = _CachingCursor(
+                cache,
+                self._result_cache_key,
+                [
+                    _table_key(table)
+                    for table in sql_util.find_tables(self.compiled.statement)
+                ],
+                self.cursor,
+            )
+
+
+# approximate maximum number of characters in a Jet SQL statement
+MAX_STATEMENT_LENGTH = 64000
+
 
 class AccessCompiler(compiler.SQLCompiler):
     extract_map = compiler.SQLCompiler.extract_map.copy()
@@ -192,34 +488,437 @@ class AccessCompiler(compiler.SQLCompiler):
         "length": "len",
     }
 
-    def visit_function(self, func, **kw):
+    def visit_function(self, func, add_to_result_map=None, **kw):
         """Access function names differ from the ANSI SQL names;
-        rewrite common ones"""
-        func.name = self.function_rewrites.get(func.name, func.name)
-        return super(AccessCompiler, self).visit_function(func)
+        rewrite common ones. The function element itself must not be
+        modified because it may be part of a cached statement."""
+        name = self.function_rewrites.get(func.name.lower())
+        if name is None:
+            return super(AccessCompiler, self).visit_function(
+                func, add_to_result_map=add_to_result_map, **kw
+            )
+        if add_to_result_map is not None:
+            add_to_result_map(func.name, func.name, (func.name,), func.type)
+        return name + self.function_argspec(func, **kw)
+
+    distinct_aggregates = ("count", "sum", "avg")
+
+    def _distinct_aggregate_argument(self, column):
+        """The argument of a COUNT/SUM/AVG(DISTINCT arg) column, or None"""
+        if isinstance(column, elements.Label):
+            column = column.element
+        if (
+            isinstance(column, functions.FunctionElement)
+            and column.name.lower() in self.distinct_aggregates
+        ):
+            args = column.clauses.clauses
+            if (
+                len(args) == 1
+                and isinstance(args[0], elements.UnaryExpression)
+                and args[0].operator is operators.distinct_op
+            ):
+                return args[0].element
+        return None
+
+    def _contains_distinct_aggregate(self, expr):
+        """Whether a COUNT/SUM/AVG(DISTINCT ...) is nested in ``expr``,
+        outside of subqueries (which are rewritten on their own)"""
+        stack = list(expr.get_children())
+        while stack:
+            element = stack.pop()
+            if isinstance(
+                element, (selectable.SelectBase, selectable.ScalarSelect)
+            ):
+                continue
+            if self._distinct_aggregate_argument(element) is not None:
+                return True
+            stack.extend(element.get_children())
+        return False
+
+    def _is_correlated(self, select_stmt, asfrom=False, lateral=False, **kw):
+        """Whether ``select_stmt`` leaves out FROMs of an enclosing select,
+        determined the way the compiler's select stack does"""
+        if not self.stack:
+            return False
+        entry = self.stack[-1]
+        compile_state = select_stmt._compile_state_factory(select_stmt, self)
+        if asfrom and not lateral:
+            froms = compile_state._get_display_froms(
+                explicit_correlate_froms=entry["correlate_froms"].difference(
+                    entry["asfrom_froms"]
+                ),
+                implicit_correlate_froms=(),
+            )
+        else:
+            froms = compile_state._get_display_froms(
+                explicit_correlate_froms=entry["correlate_froms"],
+                implicit_correlate_froms=entry["asfrom_froms"],
+            )
+        return len(froms) < len(compile_state.froms)
+
+    def _rewrite_distinct_aggregates(self, select_stmt, **kw):
+        """Jet does not support DISTINCT in aggregate functions, so rewrite
+
+            SELECT g, COUNT(DISTINCT x) FROM t GROUP BY g
+
+        as
+
+            SELECT anon.g, COUNT(anon.x)
+            FROM (SELECT DISTINCT t.g, t.x FROM t) AS anon GROUP BY anon.g
+
+        Returns None if the select has no DISTINCT aggregates. A correlated
+        subquery cannot be rewritten, because the derived table could not
+        refer to the enclosing select's tables.
+        """
+        columns = list(select_stmt.selected_columns)
+        arguments = [self._distinct_aggregate_argument(col) for col in columns]
+        for col, arg in zip(columns, arguments):
+            if arg is None and self._contains_distinct_aggregate(col):
+                raise exc.CompileError(
+                    "Access can only emulate aggregates over DISTINCT that "
+                    "are selected on their own, not within an expression"
+                )
+        distinct_args = [arg for arg in arguments if arg is not None]
+        if not distinct_args:
+            return None
+        argument = distinct_args[0]
+        if not all(arg.compare(argument) for arg in distinct_args):
+            raise exc.CompileError(
+                "Access can only emulate aggregates over DISTINCT for a "
+                "single expression per SELECT"
+            )
+        if select_stmt._having_criteria:
+            raise exc.CompileError(
+                "Access cannot emulate aggregates over DISTINCT together "
+                "with HAVING"
+            )
+        if self._is_correlated(select_stmt, **kw):
+            raise exc.CompileError(
+                "Access cannot emulate aggregates over DISTINCT in a "
+                "correlated subquery"
+            )
+        group_by = list(select_stmt._group_by_clauses)
+        distinct_rows = (
+            select_stmt.with_only_columns(
+                *[expr.label(None) for expr in group_by + [argument]],
+                maintain_column_froms=True
+            )
+            .group_by(None)
+            .order_by(None)
+            .limit(None)
+            .distinct()
+            .subquery()
+        )
+
+        def outer_column(expr):
+            if isinstance(expr, elements.Label):
+                expr = expr.element
+            for idx, group_expr in enumerate(group_by):
+                if expr.compare(group_expr):
+                    return distinct_rows.c[idx]
+            for idx, col in enumerate(columns):
+                if isinstance(col, elements.Label):
+                    col = col.element
+                if arguments[idx] is not None and expr.compare(col):
+                    return outer_columns[idx]
+            raise exc.CompileError(
+                "Access cannot emulate aggregates over DISTINCT together "
+                "with other aggregates or ungrouped columns"
+            )
+
+        outer_columns = []
+        for col, arg in zip(columns, arguments):
+            if arg is not None:
+                func_ = col.element if isinstance(col, elements.Label) else col
+                outer_col = functions.Function(
+                    func_.name,
+                    distinct_rows.c[len(group_by)],
+                    type_=func_.type,
+                )
+            else:
+                outer_col = outer_column(col)
+            if isinstance(col, (elements.Label, elements.ColumnClause)):
+                outer_col = outer_col.label(col.name)
+            outer_columns.append(outer_col)
+
+        order_by = []
+        for clause in select_stmt._order_by_clauses:
+            modifier = None
+            if isinstance(clause, elements.UnaryExpression) and (
+                clause.modifier in (operators.asc_op, operators.desc_op)
+            ):
+                modifier = clause.modifier
+                clause = clause.element
+            if isinstance(clause, elements._label_reference):
+                clause = clause.element
+            if isinstance(clause, elements._textual_label_reference):
+                clause = select_stmt.selected_columns[clause.element]
+            outer_col = outer_column(clause)
+            if modifier is operators.desc_op:
+                outer_col = outer_col.desc()
+            order_by.append(outer_col)
+
+        return (
+            select(*outer_columns)
+            .group_by(*distinct_rows.c[: len(group_by)])
+            .order_by(*order_by)
+            .limit(select_stmt._limit)
+        )
+
+    def visit_select(self, select_stmt, **kw):
+        rewritten = self._rewrite_distinct_aggregates(select_stmt, **kw)
+        if rewritten is None:
+            return super(AccessCompiler, self).visit_select(select_stmt, **kw)
+        toplevel = not self.stack
+        text = super(AccessCompiler, self).visit_select(rewritten, **kw)
+        if toplevel:
+            # let results be looked up by the columns of the original select
+            self._result_columns = [
+                entry._replace(objects=entry.objects + (col,))
+                for entry, col in zip(
+                    self._result_columns, select_stmt.selected_columns
+                )
+            ]
+        return text
+
+    def _literal_execute_expanding_parameter(self, name, parameter, values):
+        """Render long IN lists of integers or strings as literals; Jet
+        reports "Query is too complex" for statements with many parameters"""
+        threshold = self.dialect.in_literal_threshold
+        if (
+            threshold is not None
+            and len(values) > threshold
+            and isinstance(parameter.type, (types.Integer, types.String))
+        ):
+            to_update, replacement = (
+                self._literal_execute_expanding_parameter_literal_binds(
+                    parameter, values
+                )
+            )
+            if len(replacement) > MAX_STATEMENT_LENGTH:
+                raise exc.CompileError(
+                    "IN list of %d values for parameter '%s' renders to %d "
+                    "characters, over Jet's limit of about %d characters "
+                    "per statement; load the values into a staging table "
+                    "with StagingDatabase.in_() instead"
+                    % (
+                        len(values),
+                        name,
+                        len(replacement),
+                        MAX_STATEMENT_LENGTH,
+                    )
+                )
+            return to_update, replacement
+        return super(
+            AccessCompiler, self
+        )._literal_execute_expanding_parameter(name, parameter, values)
 
     def for_update_clause(self, select, **kw):
         """FOR UPDATE is not supported by Access; silently ignore"""
         return ""
 
+    def _format_external_table(self, table):
+        """The name of ``table``, prefixed with Jet's ``[;DATABASE=<path>]``
+        if it lives in another database file. Unlike the ``IN '<path>'``
+        clause, this works anywhere a table name is allowed, e.g., in joins
+        and UPDATE targets, and for tables in different files."""
+        name = self.preparer.quote(table.name)
+        dialect_options = getattr(table, "dialect_options", None)
+        if dialect_options is None:
+            return name
+        database = dialect_options["access"]["database"]
+        if not database:
+            return name
+        if "]" in database:
+            raise exc.CompileError(
+                "Database path '%s' of table '%s' cannot contain ']'"
+                % (database, table.name)
+            )
+        return "[;DATABASE=%s].%s" % (database, name)
+
     # Strip schema
-    def visit_table(self, table, asfrom=False, **kw):
+    def visit_table(self, table, asfrom=False, from_linter=None, **kw):
+        if from_linter:
+            from_linter.froms[table] = table.fullname
         if asfrom:
-            return self.preparer.quote(table.name)
+            return self._format_external_table(table)
         else:
             return ""
 
-    def visit_join(self, join, asfrom=False, **kw):
+    def visit_insert(self, insert_stmt, **kw):
+        text = super(AccessCompiler, self).visit_insert(insert_stmt, **kw)
+        table = insert_stmt.table
+        target = self._format_external_table(table)
+        if target != self.preparer.quote(table.name):
+            # the INSERT target is rendered with format_table()
+            text = text.replace(
+                "INSERT INTO %s" % self.preparer.format_table(table),
+                "INSERT INTO %s" % target,
+                1,
+            )
+        return text
+
+    def visit_join(self, join, asfrom=False, from_linter=None, **kw):
+        if from_linter:
+            from_linter.edges.update(
+                itertools.product(
+                    sql_base._de_clone(join.left._from_objects),
+                    sql_base._de_clone(join.right._from_objects),
+                )
+            )
         return (
             "("
-            + self.process(join.left, asfrom=True)
+            + self.process(
+                join.left, asfrom=True, from_linter=from_linter, **kw
+            )
             + (join.isouter and " LEFT OUTER JOIN " or " INNER JOIN ")
-            + self.process(join.right, asfrom=True)
+            + self.process(
+                join.right, asfrom=True, from_linter=from_linter, **kw
+            )
             + " ON "
-            + self.process(join.onclause)
+            + self.process(join.onclause, from_linter=from_linter, **kw)
             + ")"
         )
 
+    def visit_cte(self, cte, asfrom=False, **kw):
+        """Access SQL has no WITH clause, so render a non-recursive CTE as a
+        derived table wherever it is referenced"""
+        if cte.recursive:
+            raise exc.CompileError(
+                "Access does not support recursive common table expressions"
+            )
+        kw.pop("cte_opts", None)
+        kw.pop("visiting_cte", None)
+        return self.visit_alias(cte, asfrom=asfrom, subquery=True, **kw)
+
+    # UPDATE a INNER JOIN b ON ... SET a.x = b.y
+    render_table_with_column_in_update_from = True
+
+    def _join_dml_froms(self, dml_stmt, from_table, extra_froms, **kw):
+        """Join the extra FROMs of a multi-table UPDATE or DELETE to the target
+        table, using the WHERE criteria that relate them as ON clauses"""
+        kw["asfrom"] = True
+        criteria = []
+        for criterion in dml_stmt._where_criteria:
+            if isinstance(criterion, elements.BooleanClauseList) and (
+                criterion.operator is operators.and_
+            ):
+                criteria.extend(criterion.clauses)
+            else:
+                criteria.append(criterion)
+        joined = set(sql_util._from_objects(from_table))
+        text = from_table._compiler_dispatch(self, iscrud=True, **kw)
+        pending = list(extra_froms)
+        while pending:
+            for extra in pending:
+                onclause = [
+                    criterion
+                    for criterion in criteria
+                    if extra in criterion._from_objects
+                    and joined.intersection(criterion._from_objects)
+                    and joined.union([extra]).issuperset(
+                        criterion._from_objects
+                    )
+                ]
+                if onclause:
+                    break
+            else:
+                raise exc.CompileError(
+                    "Access requires a WHERE condition that relates each "
+                    "additional table of a multi-table UPDATE or DELETE "
+                    "to the target table"
+                )
+            if len(joined) > 1:
+                text = "(%s)" % text
+            text += " INNER JOIN %s ON %s" % (
+                extra._compiler_dispatch(self, **kw),
+                self.process(elements.and_(*onclause), **kw),
+            )
+            joined.add(extra)
+            pending.remove(extra)
+        return text
+
+    def update_tables_clause(self, update_stmt, from_table, extra_froms, **kw):
+        if not extra_froms:
+            return super(AccessCompiler, self).update_tables_clause(
+                update_stmt, from_table, extra_froms, **kw
+            )
+        return self._join_dml_froms(update_stmt, from_table, extra_froms, **kw)
+
+    def update_from_clause(
+        self, update_stmt, from_table, extra_froms, from_hints, **kw
+    ):
+        # the extra FROMs are joined in update_tables_clause
+        return None
+
+    def delete_table_clause(self, delete_stmt, from_table, extra_froms, **kw):
+        if not extra_froms:
+            return super(AccessCompiler, self).delete_table_clause(
+                delete_stmt, from_table, extra_froms, **kw
+            )
+        # completed by visit_delete
+        return "DISTINCTROW %s.* FROM %s" % (
+            self.preparer.quote(from_table.name),
+            self._join_dml_froms(delete_stmt, from_table, extra_froms, **kw),
+        )
+
+    def delete_extra_from_clause(
+        self, delete_stmt, from_table, extra_froms, from_hints, **kw
+    ):
+        # the extra FROMs are joined in delete_table_clause
+        return None
+
+    def visit_delete(self, delete_stmt, **kw):
+        """Access uses "DELETE DISTINCTROW a.* FROM a INNER JOIN b ON ..."
+        to delete rows based on another table"""
+        text = super(AccessCompiler, self).visit_delete(delete_stmt, **kw)
+        return text.replace("FROM DISTINCTROW ", "DISTINCTROW ", 1)
+
+    def visit_access_merge(self, merge, **kw):
+        """Jet's UPDATE ... RIGHT JOIN upsert idiom; see dml.Merge"""
+        self.stack.append(
+            {
+                "correlate_froms": {merge.target},
+                "asfrom_froms": {merge.target},
+                "selectable": merge,
+            }
+        )
+        text = "UPDATE %s %s JOIN %s ON %s SET %s" % (
+            self.process(merge.target, asfrom=True, **kw),
+            "RIGHT" if merge.upsert else "INNER",
+            self.process(merge.source, asfrom=True, **kw),
+            self.process(merge.onclause, **kw),
+            ", ".join(
+                "%s = %s"
+                % (self.process(col, **kw), self.process(value, **kw))
+                for col, value in merge.set_clauses
+            ),
+        )
+        self.stack.pop(-1)
+        return text
+
+    def visit_access_crosstab(self, crosstab, **kw):
+        """TRANSFORM ... SELECT ... PIVOT; see ext.Crosstab"""
+        self.stack.append(
+            {
+                "correlate_froms": set(),
+                "asfrom_froms": set(),
+                "selectable": crosstab,
+            }
+        )
+        text = "TRANSFORM %s %s PIVOT %s" % (
+            self.process(crosstab.value, **kw),
+            self.process(crosstab.select, **kw),
+            self.process(crosstab.pivot, **kw),
+        )
+        if crosstab.in_ is not None:
+            text += " IN (%s)" % ", ".join(
+                self.render_literal_value(value, crosstab.pivot.type)
+                for value in crosstab.in_
+            )
+        self.stack.pop(-1)
+        return text
+
     def visit_extract(self, extract, **kw):
         field = self.extract_map.get(extract.field, extract.field)
         return 'DATEPART("%s", %s)' % (field, self.process(extract.expr, **kw))
@@ -238,10 +937,16 @@ class AccessCompiler(compiler.SQLCompiler):
         stmt = "SELECT %s FROM USysSQLAlchemyDUAL WHERE 1=0" % literal
         return stmt
 
+    def visit_mod_binary(self, binary, operator, **kw):
+        return "%s MOD %s" % (
+            self.process(binary.left, **kw),
+            self.process(binary.right, **kw),
+        )
+
     def visit_ne_binary(self, binary, operator, **kw):
         return "%s <> %s" % (
-            self.process(binary.left),
-            self.process(binary.right),
+            self.process(binary.left, **kw),
+            self.process(binary.right, **kw),
         )
 
     def _get_limit_or_fetch(self, select):  # SQLA_1.4+
@@ -271,6 +976,35 @@ class AccessCompiler(compiler.SQLCompiler):
         )
 
 
+class AccessQueryDefCompiler(AccessCompiler):
+    """
+    Compiles a statement as the body of a saved parameter query (QueryDef),
+    rendering each bound parameter as a named Jet query parameter.
+    """
+
+    querydef_parameter_prefix = "prm_"
+
+    def __init__(self, *args, **kwargs):
+        # name -> type of each query parameter, in order of first use
+        self.querydef_parameters = {}
+        super(AccessQueryDefCompiler, self).__init__(*args, **kwargs)
+
+    def visit_bindparam(self, bindparam, **kw):
+        if bindparam.expanding:
+            raise exc.CompileError(
+                "Expanding IN parameters can't be used in a saved query"
+            )
+        if kw.get("literal_execute") or bindparam.literal_execute:
+            # e.g., TOP n; becomes part of the saved query's SQL
+            return self.render_literal_bindparam(bindparam, **kw)
+        super(AccessQueryDefCompiler, self).visit_bindparam(bindparam, **kw)
+        name = self._truncate_bindparam(bindparam)
+        self.querydef_parameters.setdefault(name, bindparam.type)
+        return self.preparer.quote_identifier(
+            self.querydef_parameter_prefix + name
+        )
+
+
 class AccessTypeCompiler(compiler.GenericTypeCompiler):
     def visit_big_integer(self, type_, **kw):
         """
@@ -319,6 +1053,9 @@ class AccessTypeCompiler(compiler.GenericTypeCompiler):
     def visit_UUID(self, type_, **kw):
         return GUID.__visit_name__
 
+    def visit_uuid(self, type_, **kw):
+        return GUID.__visit_name__
+
 
 class AccessDDLCompiler(compiler.DDLCompiler):
     def get_column_specification(self, column, **kw):
@@ -347,11 +1084,63 @@ class AccessDDLCompiler(compiler.DDLCompiler):
 
         return colspec
 
+    def visit_create_querydef(self, create, **kw):
+        body = AccessQueryDefCompiler(self.dialect, create.element)
+        parameters = []
+        for name, type_ in body.querydef_parameters.items():
+            # Jet's VALUE type is a Variant
+            type_sql = (
+                "VALUE"
+                if type_._isnull
+                else self.dialect.type_compiler.process(type_)
+            )
+            parameters.append(
+                "%s %s"
+                % (
+                    self.preparer.quote_identifier(
+                        body.querydef_parameter_prefix + name
+                    ),
+                    type_sql,
+                )
+            )
+        return "CREATE PROCEDURE %s %sAS %s" % (
+            self.preparer.quote(create.name),
+            "(%s) " % ", ".join(parameters) if parameters else "",
+            body.string,
+        )
+
+    def visit_drop_querydef(self, drop, **kw):
+        return "DROP PROCEDURE %s" % self.preparer.quote(drop.name)
+
+    def visit_alter_counter(self, alter, **kw):
+        column = alter.element
+        return "ALTER TABLE %s ALTER COLUMN %s COUNTER(%d, %d)" % (
+            self.preparer.format_table(column.table),
+            self.preparer.format_column(column),
+            alter.seed,
+            alter.increment,
+        )
+
+    index_with_options = ("PRIMARY", "DISALLOW NULL", "IGNORE NULL")
+
+    def visit_create_index(self, create, **kw):
+        text = super(AccessDDLCompiler, self).visit_create_index(create, **kw)
+        with_option = create.element.dialect_options["access"]["with"]
+        if with_option:
+            with_option = " ".join(with_option.upper().split())
+            if with_option not in self.index_with_options:
+                raise exc.CompileError(
+                    "access_with must be one of %s, not %r"
+                    % (", ".join(self.index_with_options), with_option)
+                )
+            text += " WITH %s" % with_option
+        return text
+
     def visit_drop_index(self, drop, **kw):
         index = drop.element
-        self.append(
-            "\nDROP INDEX [%s].[%s]"
-            % (index.table.name, self._index_identifier(index.name))
+        return "\nDROP INDEX %s ON %s" % (
+            self._prepared_index_name(index, include_schema=False),
+            self.preparer.format_table(index.table),
         )
 
 
@@ -661,9 +1450,40 @@ class AccessIdentifierPreparer(compiler.IdentifierPreparer):
         )
 
 
+class AccessInspector(reflection.Inspector):
+    def get_table_row_counts(self, table_names=None, **kw):
+        """
+        Return a dict of the number of rows in each of ``table_names``, or
+        in every table if ``table_names`` is None.
+
+        The counts of local tables come from DAO's TableDef.RecordCount,
+        which does not scan the table but only sees committed rows. Linked
+        tables are counted with SELECT COUNT(*). Results are cached by the
+        inspector.
+        """
+        if table_names is not None:
+            table_names = tuple(table_names)
+        with self._operation_context() as conn:
+            return self.dialect.get_table_row_counts(
+                conn, table_names, info_cache=self.info_cache, **kw
+            )
+
+    def get_table_row_count(self, table_name, **kw):
+        """Return the number of rows in ``table_name``; see
+        get_table_row_counts()"""
+        return self.get_table_row_counts([table_name], **kw)[table_name]
+
+
 class AccessDialect(default.DefaultDialect):
-    colspecs = {}
+    colspecs = {types.Uuid: GUID}
     name = "access"
+    construct_arguments = [
+        # access_database: path of the database file containing the table,
+        # rendered as Jet's [;DATABASE=<path>] table prefix
+        (sa_schema.Table, {"database": None}),
+        # access_with: "PRIMARY", "DISALLOW NULL" or "IGNORE NULL"
+        (sa_schema.Index, {"with": None}),
+    ]
     supports_native_boolean = (
         True  # suppress CHECK constraint on YesNo columns
     )
@@ -678,9 +1498,87 @@ class AccessDialect(default.DefaultDialect):
     poolclass = pool.NullPool
     statement_compiler = AccessCompiler
     ddl_compiler = AccessDDLCompiler
+    # pass access_database=<path> through to the reflection methods
+    reflection_options = ("access_database",)
     type_compiler = AccessTypeCompiler
     preparer = AccessIdentifierPreparer
     execution_ctx_cls = AccessExecutionContext
+    inspector = AccessInspector
+
+    def __init__(
+        self,
+        in_literal_threshold=250,
+        result_cache=None,
+        executemany_batch_threshold=None,
+        **kw
+    ):
+        """
+        :param in_literal_threshold: IN lists with more values than this are
+            rendered as literals instead of parameters. ``None`` disables
+            this. Lists that would exceed Jet's 64K character statement
+            limit raise CompileError; load those with
+            ``StagingDatabase.in_()`` instead.
+        :param result_cache: an optional ``cache.ResultCache`` that keeps
+            the rows of SELECT statements.
+        :param executemany_batch_threshold: executemany UPDATE and DELETE
+            statements with at least this many parameter sets are applied
+            in one statement through a scratch table; see the ``batch``
+            module. ``None`` (the default) disables this.
+        """
+        super(AccessDialect, self).__init__(**kw)
+        self.in_literal_threshold = in_literal_threshold
+        self.result_cache = result_cache
+        self.executemany_batch_threshold = executemany_batch_threshold
+        if executemany_batch_threshold is not None:
+            # do_executemany() adds up the rowcount of each parameter set
+            self.supports_sane_multi_rowcount = True
+            self._batch_statements = util.LRUCache(100)
+            self._batch_tables = set()
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        if (
+            self.executemany_batch_threshold is None
+            or context is None
+            or not (context.isupdate or context.isdelete)
+        ):
+            return super(AccessDialect, self).do_executemany(
+                cursor, statement, parameters, context
+            )
+        batch = None
+        if len(parameters) >= self.executemany_batch_threshold:
+            batch = self._batch_statements.get(statement)
+            if batch is None:
+                batch = batch_statements(self, context.compiled) or False
+                self._batch_statements[statement] = batch
+        if not batch:
+            # Jet executes the parameter sets one at a time anyway
+            rowcount = 0
+            for params in parameters:
+                cursor.execute(statement, params)
+                rowcount += cursor.rowcount
+            context._rowcount = rowcount
+            return
+
+        batch_id = uuid.uuid4().hex
+        scratch_cursor = cursor.connection.cursor()
+        try:
+            if batch.table_name not in self._batch_tables:
+                scratch_cursor.tables(table=batch.table_name)
+                if scratch_cursor.fetchone() is None:
+                    scratch_cursor.execute(batch.create_sql)
+                self._batch_tables.add(batch.table_name)
+            scratch_cursor.executemany(
+                batch.insert_sql,
+                [
+                    (batch_id,) + tuple(params[i] for i in batch.positions)
+                    for params in parameters
+                ],
+            )
+            cursor.execute(batch.apply_sql, (batch_id,))
+            context._rowcount = cursor.rowcount
+            scratch_cursor.execute(batch.cleanup_sql, (batch_id,))
+        finally:
+            scratch_cursor.close()
 
     @classmethod
     def dbapi(cls):
@@ -700,19 +1598,127 @@ class AccessDialect(default.DefaultDialect):
     def last_inserted_ids(self):
         return self.context.last_inserted_ids
 
-    def has_table(self, connection, tablename, schema=None, info_cache=None):
-        pyodbc_crsr = connection.connection.cursor()
-        result = [
-            row.table_name
-            for row in pyodbc_crsr.tables().fetchall()
-            if row.table_name.casefold() == tablename.casefold()
+    def truncate_table(self, connection, table_name, strategy="auto"):
+        """
+        Remove all rows from a table and reset its AutoNumber column.
+
+        :param strategy: ``"delete"`` deletes the rows and then resets the
+            AutoNumber seed with ``ALTER COLUMN ... COUNTER(1, 1)``.
+            ``"recreate"`` drops the table and creates it again from its
+            reflected definition, including indexes and foreign keys, which
+            also releases the space used by its rows; it is not possible
+            for a table referenced by other tables. ``"auto"`` (the default)
+            recreates the table if it is not referenced, and deletes
+            otherwise.
+        """
+        if strategy not in ("auto", "delete", "recreate"):
+            raise exc.ArgumentError("Unknown truncate strategy %r" % strategy)
+        table = sa_schema.Table(
+            table_name, sa_schema.MetaData(), autoload_with=connection
+        )
+        if strategy != "delete":
+            db = self._get_dao_database(connection, table_name)
+            referenced = any(
+                rel.Table.casefold() == table_name.casefold()
+                for rel in db.Relations
+            )
+            if referenced and strategy == "recreate":
+                raise exc.InvalidRequestError(
+                    "Table '%s' is referenced by other tables and cannot be "
+                    "recreated" % table_name
+                )
+            strategy = "delete" if referenced else "recreate"
+        if strategy == "recreate":
+            table.drop(connection)
+            table.create(connection)
+        else:
+            connection.execute(table.delete())
+            for column in table.columns:
+                if isinstance(column.type, COUNTER) or (
+                    column.autoincrement is True
+                ):
+                    connection.execute(AlterCounter(column))
+
+    @contextlib.contextmanager
+    def bulk_load(self, connection, table_name):
+        """
+        Drop the secondary indexes and foreign keys of a table while it is
+        loaded, and recreate them afterwards, e.g.::
+
+            with engine.begin() as conn:
+                with engine.dialect.bulk_load(conn, "orders"):
+                    conn.execute(orders.insert(), rows)
+
+        Jet then builds each index once instead of maintaining it for every
+        inserted row. The primary key is kept.
+        """
+        table = sa_schema.Table(
+            table_name, sa_schema.MetaData(), autoload_with=connection
+        )
+        foreign_keys = [
+            fk for fk in table.foreign_key_constraints if fk.name is not None
         ]
+        # the primary key and relation indexes are not reflected as indexes
+        indexes = list(table.indexes)
+        for fk in foreign_keys:
+            connection.execute(sa_schema.DropConstraint(fk))
+        for idx in indexes:
+            connection.execute(sa_schema.DropIndex(idx))
+        try:
+            yield table
+        finally:
+            for idx in indexes:
+                connection.execute(sa_schema.CreateIndex(idx))
+            for fk in foreign_keys:
+                connection.execute(sa_schema.AddConstraint(fk))
+            missing = {idx.name for idx in indexes}.difference(
+                idx["name"] for idx in self.get_indexes(connection, table_name)
+            ) | {fk.name for fk in foreign_keys}.difference(
+                fk["name"]
+                for fk in self.get_foreign_keys(connection, table_name)
+            )
+            if missing:
+                raise exc.InvalidRequestError(
+                    "Indexes or foreign keys of table '%s' were not "
+                    "recreated: %s" % (table_name, ", ".join(sorted(missing)))
+                )
+
+    @contextlib.contextmanager
+    def _get_pyodbc_connection(self, connection, access_database=None):
+        """The pyodbc connection for reflection, or a temporary connection
+        to another database file if access_database is specified"""
+        if access_database is None:
+            yield connection.connection
+            return
+        pyodbc_cnxn = pyodbc.connect(
+            self._get_odbc_connection_string(
+                connection.connection.cursor(), access_database
+            )
+        )
+        try:
+            yield pyodbc_cnxn
+        finally:
+            pyodbc_cnxn.close()
+
+    def has_table(self, connection, tablename, schema=None, **kw):
+        with self._get_pyodbc_connection(
+            connection, kw.get("access_database")
+        ) as pyodbc_cnxn:
+            pyodbc_crsr = pyodbc_cnxn.cursor()
+            result = [
+                row.table_name
+                for row in pyodbc_crsr.tables().fetchall()
+                if row.table_name.casefold() == tablename.casefold()
+            ]
         return bool(result)
 
     @reflection.cache
     def get_table_names(self, connection, schema=None, **kw):
-        pyodbc_crsr = connection.connection.cursor()
-        result = pyodbc_crsr.tables(tableType="TABLE").fetchall()
+        with self._get_pyodbc_connection(
+            connection, kw.get("access_database")
+        ) as pyodbc_cnxn:
+            pyodbc_crsr = pyodbc_cnxn.cursor()
+            result = pyodbc_crsr.tables(tableType="TABLE").fetchall()
         table_names = [
             row.table_name
             for row in result
@@ -725,9 +1731,20 @@ class AccessDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_view_names(self, connection, schema=None, **kw):
-        pyodbc_crsr = connection.connection.cursor()
-        result = pyodbc_crsr.tables(tableType="VIEW").fetchall()
-        return [row[2] for row in result]
+        with self._get_pyodbc_connection(
+            connection, kw.get("access_database")
+        ) as pyodbc_cnxn:
+            pyodbc_crsr = pyodbc_cnxn.cursor()
+            result = pyodbc_crsr.tables(tableType="VIEW").fetchall()
+            # saved parameter queries (e.g., from CREATE PROCEDURE)
+            procedures = pyodbc_crsr.procedures().fetchall()
+        view_names = [row[2] for row in result]
+        view_names.extend(
+            row.procedure_name
+            for row in procedures
+            if row.procedure_name not in view_names
+        )
+        return view_names
 
     def _decode_sketchy_utf16(self, raw_bytes):
         # work around bug in Access ODBC driver
@@ -742,7 +1759,12 @@ class AccessDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_columns(self, connection, table_name, schema=None, **kw):
-        pyodbc_cnxn = connection.connection
+        with self._get_pyodbc_connection(
+            connection, kw.get("access_database")
+        ) as pyodbc_cnxn:
+            return self._get_columns(pyodbc_cnxn, table_name)
+
+    def _get_columns(self, pyodbc_cnxn, table_name):
         # work around bug in Access ODBC driver
         # ref: https://github.com/mkleehammer/pyodbc/issues/328
         prev_converter = pyodbc_cnxn.get_output_converter(pyodbc.SQL_WVARCHAR)
@@ -778,83 +1800,135 @@ class AccessDialect(default.DefaultDialect):
             self, connection, table_name, schema=schema, **kw
         )
 
+    def _get_database_path(self, crsr):
+        """The path of the database file that crsr is connected to"""
+        for row in crsr.tables():
+            if row.table_cat:
+                return row.table_cat
+        return None
+
     def _get_dao_string(self, crsr):
         if crsr.connection.getinfo(pyodbc.SQL_DRIVER_NAME) == "odbcjt32.dll":
             return "DAO.DBEngine.36"
         else:
             return "DAO.DBEngine.120"
 
-    @reflection.cache
-    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        pyodbc_crsr = connection.connection.cursor()
-        db_path = None
-        for row in pyodbc_crsr.tables():
-            if row.table_name == table_name:
-                db_path = row.table_cat
-                break
-        if db_path:
-            db_engine = win32com.client.Dispatch(
-                self._get_dao_string(pyodbc_crsr)
-            )
-            db = db_engine.OpenDatabase(
-                db_path,
-                False,
-                True,
-                "MS Access;PWD={}".format(connection.engine.url.password),
-            )
-            tbd = db.TableDefs(table_name)
-            for idx in tbd.Indexes:
-                if idx.Primary:
-                    return {
-                        "constrained_columns": [
-                            fld.Name for fld in idx.Fields
-                        ],
-                        "name": idx.Name,
-                    }
+    def _get_odbc_driver_name(self, crsr):
+        if crsr.connection.getinfo(pyodbc.SQL_DRIVER_NAME) == "odbcjt32.dll":
+            return "Microsoft Access Driver (*.mdb)"
         else:
+            return "Microsoft Access Driver (*.mdb, *.accdb)"
+
+    def _get_odbc_connection_string(self, crsr, db_path):
+        """ODBC connection string for another database file, using the same
+        driver as crsr"""
+        return "DRIVER={%s};DBQ=%s;ExtendedAnsiSQL=1;" % (
+            self._get_odbc_driver_name(crsr),
+            db_path,
+        )
+
+    def _get_dao_database(
+        self, connection, table_name, read_only=True, access_database=None
+    ):
+        pyodbc_crsr = connection.connection.cursor()
+        db_path = access_database
+        if db_path is None:
+            for row in pyodbc_crsr.tables():
+                if row.table_name == table_name:
+                    db_path = row.table_cat
+                    break
+        if not db_path:
             raise exc.NoSuchTableError("Table '%s' not found." % table_name)
+        if access_database is None:
+            password = connection.engine.url.password
+        else:
+            password = ""
+        db_engine = win32com.client.Dispatch(self._get_dao_string(pyodbc_crsr))
+        return db_engine.OpenDatabase(
+            db_path, False, read_only, "MS Access;PWD={}".format(password)
+        )
+
+    @reflection.cache
+    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
+        db = self._get_dao_database(
+            connection,
+            table_name,
+            access_database=kw.get("access_database"),
+        )
+        tbd = db.TableDefs(table_name)
+        for idx in tbd.Indexes:
+            if idx.Primary:
+                return {
+                    "constrained_columns": [fld.Name for fld in idx.Fields],
+                    "name": idx.Name,
+                }
+
+    @reflection.cache
+    def get_table_row_counts(
+        self, connection, table_names=None, schema=None, **kw
+    ):
+        access_database = kw.get("access_database")
+        if table_names is None:
+            table_names = self.get_table_names(
+                connection, access_database=access_database
+            )
+        if not table_names:
+            return {}
+        db = self._get_dao_database(
+            connection, table_names[0], access_database=access_database
+        )
+        counts = {}
+        try:
+            for table_name in table_names:
+                tbd = db.TableDefs(table_name)
+                if tbd.Connect or tbd.RecordCount < 0:
+                    # linked table; RecordCount is not available
+                    table = sa_schema.Table(
+                        table_name,
+                        sa_schema.MetaData(),
+                        access_database=access_database,
+                    )
+                    counts[table_name] = connection.scalar(
+                        select(functions.count()).select_from(table)
+                    )
+                else:
+                    counts[table_name] = tbd.RecordCount
+        finally:
+            db.Close()
+        return counts
 
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
-        pyodbc_crsr = connection.connection.cursor()
-        db_path = None
-        for row in pyodbc_crsr.tables():
-            if row.table_name == table_name:
-                db_path = row.table_cat
-                break
-        if db_path:
-            db_engine = win32com.client.Dispatch(
-                self._get_dao_string(pyodbc_crsr)
-            )
-            db = db_engine.OpenDatabase(
-                db_path,
-                False,
-                True,
-                "MS Access;PWD={}".format(connection.engine.url.password),
-            )
-            fk_list = []
-            for rel in db.Relations:
-                if rel.ForeignTable.casefold() == table_name.casefold():
-                    fk_dict = {
-                        "constrained_columns": [],
-                        "referred_schema": None,
-                        "referred_table": rel.Table,
-                        "referred_columns": [],
-                        "name": rel.Name,
-                    }
-                    for fld in rel.Fields:
-                        fk_dict["constrained_columns"].append(fld.ForeignName)
-                        fk_dict["referred_columns"].append(fld.Name)
-                    fk_list.append(fk_dict)
-            return fk_list
-        else:
-            raise exc.NoSuchTableError("Table '%s' not found." % table_name)
+        db = self._get_dao_database(
+            connection,
+            table_name,
+            access_database=kw.get("access_database"),
+        )
+        fk_list = []
+        for rel in db.Relations:
+            if rel.ForeignTable.casefold() == table_name.casefold():
+                fk_dict = {
+                    "constrained_columns": [],
+                    "referred_schema": None,
+                    "referred_table": rel.Table,
+                    "referred_columns": [],
+                    "name": rel.Name,
+                }
+                for fld in rel.Fields:
+                    fk_dict["constrained_columns"].append(fld.ForeignName)
+                    fk_dict["referred_columns"].append(fld.Name)
+                fk_list.append(fk_dict)
+        return fk_list
 
     @reflection.cache
     def get_indexes(self, connection, table_name, schema=None, **kw):
-        pyodbc_crsr = connection.connection.cursor()
+        with self._get_pyodbc_connection(
+            connection, kw.get("access_database")
+        ) as pyodbc_cnxn:
+            pyodbc_crsr = pyodbc_cnxn.cursor()
+            statistics = pyodbc_crsr.statistics(table_name).fetchall()
         indexes = {}
-        for row in pyodbc_crsr.statistics(table_name).fetchall():
+        for row in statistics:
             if row.index_name is not None:
                 if row.index_name in indexes:
                     indexes[row.index_name]["column_names"].append(
@@ -866,4 +1940,29 @@ class AccessDialect(default.DefaultDialect):
                         "unique": row.non_unique == 0,
                         "column_names": [row.column_name],
                     }
+        if indexes:
+            # ODBC does not report the WITH options; get them from DAO
+            db = self._get_dao_database(
+                connection,
+                table_name,
+                access_database=kw.get("access_database"),
+            )
+            for idx in db.TableDefs(table_name).Indexes:
+                if idx.Name not in indexes:
+                    continue
+                if idx.Primary or idx.Foreign:
+                    # the index of the primary key or of a relation, which
+                    # is created along with the constraint
+                    indexes[idx.Name]["duplicates_constraint"] = idx.Name
+                if idx.Primary:
+                    with_option = "PRIMARY"
+                elif idx.Required:
+                    with_option = "DISALLOW NULL"
+                elif idx.IgnoreNulls:
+                    with_option = "IGNORE NULL"
+                else:
+                    continue
+                indexes[idx.Name]["dialect_options"] = {
+                    "access_with": with_option
+                }
         return [x[1] for x in indexes.items()]
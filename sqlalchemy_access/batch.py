@@ -0,0 +1,150 @@
+# access/batch.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Batched executemany for UPDATE and DELETE statements.
+
+Jet executes each parameter set of an executemany UPDATE or DELETE as a
+separate statement. With ``executemany_batch_threshold`` set, e.g.::
+
+    engine = create_engine(
+        "access+pyodbc://@my_dsn", executemany_batch_threshold=100
+    )
+
+an executemany of at least that many parameter sets is applied in one
+statement instead. The parameter sets are inserted into a scratch table,
+which is named ``USysSQLAlchemyBatch_<hash>`` so that Access hides it
+with the other system objects. That table is joined to the target table::
+
+    UPDATE t INNER JOIN scratch ON t.id = scratch.p1
+    SET t.x = scratch.p0 WHERE ...
+
+    DELETE DISTINCTROW t.* FROM t INNER JOIN scratch ON t.id = scratch.p0
+    WHERE ...
+
+The rows of the batch are deleted from the scratch table afterwards; the
+table itself is kept for the next batch of the same statement.
+
+Smaller batches, and statements that cannot be rewritten this way, are
+executed one parameter set at a time. Either way, the rowcount is the
+total number of rows matched, so the dialect reports
+``supports_sane_multi_rowcount`` when batching is enabled.
+"""
+import collections
+import hashlib
+
+from sqlalchemy import Column, MetaData, String, Table, delete, exc, update
+from sqlalchemy import bindparam
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import elements, visitors
+from sqlalchemy.sql import util as sql_util
+
+SCRATCH_TABLE_PREFIX = "USysSQLAlchemyBatch_"
+
+_Batch = collections.namedtuple(
+    "_Batch",
+    [
+        "table_name",
+        "create_sql",
+        "insert_sql",
+        "positions",
+        "apply_sql",
+        "cleanup_sql",
+    ],
+)
+
+
+def batch_statements(dialect, compiled):
+    """
+    Return the statements that apply an executemany of ``compiled`` (an
+    UPDATE or DELETE) through a scratch table, or None if the statement
+    cannot be rewritten.
+    """
+    stmt = compiled.statement
+    if (
+        not compiled.positional
+        or not compiled.positiontup
+        or compiled.effective_returning
+        or not isinstance(stmt.table, Table)
+        or set(sql_util.find_tables(stmt)) != {stmt.table}
+    ):
+        return None
+
+    # a scratch column for each distinct parameter, in order
+    columns = {}
+    for name in compiled.positiontup:
+        if name not in columns:
+            if compiled.binds[name].type._isnull:
+                return None
+            columns[name] = "p%d" % len(columns)
+    positions = tuple(compiled.positiontup.index(name) for name in columns)
+
+    digest = hashlib.sha1(compiled.string.encode("utf-8")).hexdigest()
+    scratch = Table(
+        SCRATCH_TABLE_PREFIX + digest[:16],
+        MetaData(),
+        Column("batch_id", String(32)),
+        *[
+            Column(column_name, compiled.binds[name].type)
+            for name, column_name in columns.items()
+        ]
+    )
+
+    replaced = set()
+    unresolved = []
+
+    def replace(element):
+        if isinstance(element, elements.BindParameter):
+            name = compiled.bind_names.get(element)
+            if name not in columns:
+                unresolved.append(element)
+                return None
+            replaced.add(name)
+            return scratch.c[columns[name]]
+        return None
+
+    whereclause = [
+        visitors.replacement_traverse(criterion, {}, replace)
+        for criterion in stmt._where_criteria
+    ]
+    whereclause.append(scratch.c.batch_id == bindparam("batch_id"))
+    if compiled.isupdate:
+        values = {
+            key: visitors.replacement_traverse(value, {}, replace)
+            for key, value in (stmt._values or {}).items()
+        }
+        # the parameters of the SET clause that were not given as values()
+        # are named after their columns
+        for name in columns:
+            if name in replaced:
+                continue
+            column = stmt.table.c.get(compiled.binds[name].key)
+            if column is None:
+                return None
+            values[column] = scratch.c[columns[name]]
+        apply_stmt = update(stmt.table).where(*whereclause).values(values)
+    else:
+        if len(replaced) != len(columns):
+            return None
+        apply_stmt = delete(stmt.table).where(*whereclause)
+    if unresolved:
+        return None
+
+    try:
+        apply_sql = apply_stmt.compile(dialect=dialect).string
+    except exc.CompileError:
+        # e.g., no WHERE condition that joins the scratch table
+        return None
+    return _Batch(
+        scratch.name,
+        CreateTable(scratch).compile(dialect=dialect).string,
+        scratch.insert().compile(dialect=dialect).string,
+        positions,
+        apply_sql,
+        scratch.delete()
+        .where(scratch.c.batch_id == bindparam("batch_id"))
+        .compile(dialect=dialect)
+        .string,
+    )
@@ -0,0 +1,211 @@
+# access/cache.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+An opt-in cache for the results of SELECT statements.
+
+Pass a ResultCache to create_engine() to keep the rows of recently executed
+SELECT statements in memory::
+
+    engine = create_engine(
+        "access+pyodbc://@dashboard_dsn",
+        result_cache=ResultCache(max_entries=256, max_rows=10000),
+    )
+
+A cached result is returned without executing the statement. Entries are
+keyed by the SQL string and its parameter values, and are discarded
+
+- when the size or modification time of the database file changes, e.g.,
+  because another process wrote to it;
+- when this engine executes an INSERT, UPDATE or DELETE against a table
+  that the cached SELECT reads from. Other DML and DDL, and textual SQL
+  that is not a SELECT, clear the whole cache.
+
+SELECT statements executed in a transaction that has modified the database
+are not cached. A statement can opt out with
+``execution_options(access_result_cache=False)``.
+
+Rows are stored as the application fetches them, once the whole result has
+been fetched; results that are closed early, or that have more than
+``max_rows`` rows, are not cached.
+
+A hit saves executing the statement, and does not open an ODBC cursor,
+but the engine still checks out a DBAPI connection for it. With the
+dialect's default NullPool that means opening a new ODBC connection for
+every hit, so use a pool, e.g. ``poolclass=QueuePool``, with the cache.
+"""
+import collections
+import os
+import threading
+
+
+class _CachedCursor(object):
+    """A DBAPI cursor stand-in that returns rows from memory"""
+
+    rowcount = -1
+    arraysize = 1
+
+    def __init__(self, description, rows):
+        self.description = description
+        self._rows = collections.deque(rows)
+
+    def execute(self, statement, parameters=None):
+        return self
+
+    def fetchone(self):
+        if self._rows:
+            return self._rows.popleft()
+        return None
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        return [
+            self._rows.popleft() for _ in range(min(size, len(self._rows)))
+        ]
+
+    def fetchall(self):
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self):
+        self._rows.clear()
+
+
+class _CachingCursor(object):
+    """Passes the rows of ``cursor`` through, and stores them in ``cache``
+    once all of them have been fetched, unless there are too many."""
+
+    def __init__(self, cache, key, tables, cursor):
+        self.description = cursor.description
+        self._cache = cache
+        self._key = key
+        self._tables = tables
+        self._cursor = cursor
+        self._generation = cache._generation
+        self._rows = []
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _collect(self, rows, exhausted):
+        if self._rows is None:
+            return
+        self._rows.extend(tuple(row) for row in rows)
+        if len(self._rows) > self._cache.max_rows:
+            self._rows = None
+        elif exhausted:
+            self._cache.put(
+                self._key,
+                self._tables,
+                self.description,
+                self._rows,
+                generation=self._generation,
+            )
+            self._rows = None
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        self._collect([] if row is None else [row], row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self._cursor.arraysize
+        rows = self._cursor.fetchmany(size)
+        self._collect(rows, len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._collect(rows, True)
+        return rows
+
+    def close(self):
+        self._rows = None
+        self._cursor.close()
+
+
+class ResultCache(object):
+    def __init__(self, max_entries=128, max_rows=10000):
+        """
+        :param max_entries: the number of results to keep; the least
+            recently used one is discarded first.
+        :param max_rows: results with more rows than this are not cached.
+        """
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.database_path = None
+        self.hits = 0
+        self.misses = 0
+        # key -> (table keys, description, rows)
+        self._entries = collections.OrderedDict()
+        self._file_state = None
+        # changed whenever entries are discarded, so that rows fetched
+        # before then are not stored afterwards
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _check_file(self):
+        """Discard all entries if the database file has changed"""
+        if self.database_path is None:
+            return
+        try:
+            stat = os.stat(self.database_path)
+        except OSError:
+            file_state = None
+        else:
+            file_state = (stat.st_mtime, stat.st_size)
+        if file_state != self._file_state:
+            self._entries.clear()
+            self._file_state = file_state
+            self._generation += 1
+
+    def get(self, key):
+        """Return a cursor over the cached rows for ``key``, or None"""
+        with self._lock:
+            self._check_file()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        _, description, rows = entry
+        return _CachedCursor(description, rows)
+
+    def put(self, key, tables, description, rows, generation=None):
+        """
+        :param generation: the cache's ``_generation`` when the rows were
+            read; they are not stored if entries have been discarded since.
+        """
+        if len(rows) > self.max_rows:
+            return
+        with self._lock:
+            self._check_file()
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (frozenset(tables), description, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tables):
+        """Discard the entries that read from any of ``tables``"""
+        tables = frozenset(tables)
+        with self._lock:
+            self._generation += 1
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if not entry[0].isdisjoint(tables)
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
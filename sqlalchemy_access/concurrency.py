@@ -0,0 +1,48 @@
+# access/concurrency.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Running Access statements from asyncio code.
+
+pyodbc is a blocking driver, so execute() runs the statement in a thread pool
+and awaits the result. If the awaiting task is cancelled, for example by
+asyncio.wait_for(), the statement is cancelled in the driver as well::
+
+    async def report():
+        with engine.connect() as conn:
+            return await asyncio.wait_for(
+                execute(conn, select(orders)), timeout=30
+            )
+
+For a limit enforced by the driver itself, use the ``timeout`` execution
+option, which raises QueryTimeoutError.
+"""
+import asyncio
+import functools
+
+
+def _execute(connection, statement, parameters):
+    result = connection.execute(statement, parameters)
+    if result.returns_rows:
+        return result.fetchall()
+    return result.rowcount
+
+
+async def execute(connection, statement, parameters=None, executor=None):
+    """
+    Execute ``statement`` on ``connection`` in ``executor`` (the event
+    loop's default executor if None) and return its rows, or its rowcount
+    if it does not return rows.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        executor,
+        functools.partial(_execute, connection, statement, parameters),
+    )
+    try:
+        return await future
+    except asyncio.CancelledError:
+        connection.dialect.cancel(connection)
+        raise
@@ -0,0 +1,75 @@
+# access/dataframe.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Column type inference for loading pandas DataFrames.
+
+By default, ``DataFrame.to_sql`` creates a Long Text (Memo) column for every
+column of strings and a LongInteger or Double for every numeric column.
+infer_access_types() looks at the data instead and returns the narrowest
+Access type for each column, for use as the ``dtype`` argument::
+
+    df.to_sql("orders", engine, index=False, dtype=infer_access_types(df))
+
+pandas is only imported when infer_access_types() is called.
+"""
+from .base import Byte, Integer, LongInteger, LongText, ShortText
+
+# the longest value that fits in a Short Text column
+MAX_SHORT_TEXT_LENGTH = 255
+
+# (type, minimum, maximum) from narrowest to widest
+_INTEGER_TYPES = [
+    (Byte, 0, 255),
+    (Integer, -(2**15), 2**15 - 1),
+    (LongInteger, -(2**31), 2**31 - 1),
+]
+
+
+def _text_type(series):
+    max_length = int(series.dropna().str.len().max())
+    if max_length > MAX_SHORT_TEXT_LENGTH:
+        return LongText()
+    return ShortText(max(max_length, 1))
+
+
+def _integer_type(series):
+    values = series.dropna()
+    if not len(values):
+        return Byte()
+    low, high = values.min(), values.max()
+    for type_, type_min, type_max in _INTEGER_TYPES:
+        if type_min <= low and high <= type_max:
+            return type_()
+    # too large for Access integers; leave it to to_sql
+    return None
+
+
+def infer_access_types(df, columns=None):
+    """
+    Return a dict of column names to Access types for the text and integer
+    columns of ``df`` (optionally only those in ``columns``):
+
+    - text: ShortText(n) for the longest value if it has at most 255
+      characters, otherwise LongText;
+    - integers: the narrowest of Byte, Integer and LongInteger that holds
+      the minimum and maximum values.
+
+    Other columns are not included, so pandas picks their types.
+    """
+    from pandas.api.types import infer_dtype
+
+    dtypes = {}
+    for name in df.columns if columns is None else columns:
+        series = df[name]
+        kind = series.dtype.kind
+        if kind == "O":
+            if infer_dtype(series, skipna=True) == "string":
+                dtypes[name] = _text_type(series)
+        elif kind in "iu":
+            type_ = _integer_type(series)
+            if type_ is not None:
+                dtypes[name] = type_
+    return dtypes
@@ -0,0 +1,47 @@
+# access/ddl.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Access-specific DDL constructs, compiled by AccessDDLCompiler.
+"""
+from sqlalchemy.schema import ExecutableDDLElement
+
+
+class CreateQueryDef(ExecutableDDLElement):
+    """
+    Represent a ``CREATE PROCEDURE`` statement that saves ``statement`` as a
+    parameter query. Each bound parameter of the statement becomes a named
+    query parameter.
+    """
+
+    __visit_name__ = "create_querydef"
+
+    def __init__(self, name, statement):
+        self.name = name
+        self.element = statement
+
+
+class DropQueryDef(ExecutableDDLElement):
+    """Represent a ``DROP PROCEDURE`` statement."""
+
+    __visit_name__ = "drop_querydef"
+
+    def __init__(self, name):
+        self.name = name
+
+
+class AlterCounter(ExecutableDDLElement):
+    """
+    Represent ``ALTER TABLE ... ALTER COLUMN ... COUNTER(seed, increment)``,
+    which resets the next value of an AutoNumber column. Jet only accepts it
+    for an empty table.
+    """
+
+    __visit_name__ = "alter_counter"
+
+    def __init__(self, column, seed=1, increment=1):
+        self.element = column
+        self.seed = seed
+        self.increment = increment
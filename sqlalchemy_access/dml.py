@@ -0,0 +1,116 @@
+# access/dml.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Access-specific DML constructs.
+"""
+from sqlalchemy import and_, exc, insert, select
+from sqlalchemy.sql import coercions, roles, visitors
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+def merge(target, source, on, set_=None):
+    """
+    Construct a :class:`.Merge` that upserts the rows of ``source`` into
+    ``target`` in a single statement, e.g.::
+
+        from sqlalchemy_access import merge
+
+        stmt = merge(customers, staging_customers, on=["id"])
+        with engine.begin() as conn:
+            conn.execute(stmt)
+
+    :param target: the Table to be updated.
+    :param source: a Table, or a Select whose columns are named like the
+        columns of ``target``.
+    :param on: a list of column names that match source rows to target rows,
+        or a join condition.
+    :param set_: optional dict of target column names to source expressions.
+        Defaults to every source column that has the same name as a column
+        in ``target``.
+    """
+    return Merge(target, source, on, set_)
+
+
+class Merge(Executable, ClauseElement):
+    """
+    Represent Jet's upsert idiom::
+
+        UPDATE target RIGHT JOIN source ON ... SET target.x = source.x, ...
+
+    Updating the null-extended side of the RIGHT JOIN makes Jet insert a row
+    for each source row that has no match in the target.
+    """
+
+    __visit_name__ = "access_merge"
+
+    _traverse_internals = [
+        ("target", InternalTraversal.dp_clauseelement),
+        ("source", InternalTraversal.dp_clauseelement),
+        ("onclause", InternalTraversal.dp_clauseelement),
+        ("set_clauses", InternalTraversal.dp_clauseelement_tuples),
+        ("upsert", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, target, source, on, set_=None, upsert=True):
+        self.target = target
+        if isinstance(source, roles.SelectStatementRole):
+            source = source.subquery()
+        self.source = source
+        self._on = on
+        if isinstance(on, (list, tuple)):
+            self.keys = list(on)
+            self.onclause = and_(
+                *[target.c[key] == source.c[key] for key in self.keys]
+            )
+        else:
+            self.onclause = coercions.expect(roles.OnClauseRole, on)
+            self.keys = [col.name for col in target.primary_key] or [
+                col.name
+                for col in visitors.iterate(self.onclause)
+                if getattr(col, "table", None) is target
+            ]
+        if set_ is None:
+            set_ = {col.name: col for col in source.c if col.name in target.c}
+        self._set = set_
+        # an upsert must also set the keys of the rows it inserts
+        self.set_clauses = tuple(
+            (
+                target.c[name],
+                coercions.expect(roles.ExpressionElementRole, value),
+            )
+            for name, value in set_.items()
+            if upsert or name not in self.keys
+        )
+        self.upsert = upsert
+
+    def paired(self):
+        """
+        Return the equivalent pair of statements, to be executed in one
+        transaction: an ``UPDATE ... INNER JOIN`` for the matching rows and
+        an ``INSERT ... SELECT`` of the source rows that have no match. Use
+        this instead of the upsert idiom when the source query is not
+        updatable.
+        """
+        if not self.keys:
+            raise exc.ArgumentError(
+                "paired() needs a column of %s to find the source rows that "
+                "have no match; the table has no primary key and the join "
+                "condition does not reference it" % self.target.name
+            )
+        update_stmt = Merge(
+            self.target, self.source, self._on, self._set, upsert=False
+        )
+        insert_names = [col.name for col, _ in self.set_clauses]
+        anti_join = (
+            select(*[value for _, value in self.set_clauses])
+            .select_from(self.source.outerjoin(self.target, self.onclause))
+            .where(self.target.c[self.keys[0]].is_(None))
+        )
+        return update_stmt, insert(self.target).from_select(
+            insert_names, anti_join
+        )
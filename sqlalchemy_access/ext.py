@@ -0,0 +1,63 @@
+# access/ext.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Access-specific query constructs.
+"""
+from sqlalchemy.sql import coercions, roles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+def crosstab(value, select, pivot, in_=None):
+    """
+    Construct a :class:`.Crosstab` that lets Jet pivot the rows of a query,
+    e.g.::
+
+        from sqlalchemy_access import crosstab
+
+        stmt = crosstab(
+            func.sum(sales.c.amount),
+            select(sales.c.region).group_by(sales.c.region),
+            sales.c.quarter,
+            in_=["Q1", "Q2", "Q3", "Q4"],
+        )
+        with engine.connect() as conn:
+            rows = conn.execute(stmt).fetchall()
+
+    renders::
+
+        TRANSFORM sum(sales.amount) SELECT sales.region FROM sales
+        GROUP BY sales.region PIVOT sales.quarter IN ('Q1', 'Q2', 'Q3', 'Q4')
+
+    :param value: the aggregate expression that fills the pivoted columns.
+    :param select: a Select of the row headings, grouped by those headings.
+    :param pivot: the expression whose values become the column headings.
+    :param in_: optional list of the values of ``pivot`` to return as
+        columns, in that order. Without it, Jet returns a column for each
+        distinct value in the data, so the columns of the result can change
+        from one execution to the next.
+    """
+    return Crosstab(value, select, pivot, in_)
+
+
+class Crosstab(Executable, ClauseElement):
+    """Represent a ``TRANSFORM ... SELECT ... PIVOT`` crosstab query."""
+
+    __visit_name__ = "access_crosstab"
+
+    _traverse_internals = [
+        ("value", InternalTraversal.dp_clauseelement),
+        ("select", InternalTraversal.dp_clauseelement),
+        ("pivot", InternalTraversal.dp_clauseelement),
+        ("in_", InternalTraversal.dp_plain_obj),
+    ]
+
+    def __init__(self, value, select, pivot, in_=None):
+        self.value = coercions.expect(roles.ExpressionElementRole, value)
+        self.select = coercions.expect(roles.SelectStatementRole, select)
+        self.pivot = coercions.expect(roles.ExpressionElementRole, pivot)
+        self.in_ = tuple(in_) if in_ is not None else None
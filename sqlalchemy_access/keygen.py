@@ -0,0 +1,127 @@
+# access/keygen.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Client-side primary key generation.
+
+Rows inserted into a table with an AutoNumber (COUNTER) primary key must be
+inserted one at a time, so that ``SELECT @@identity`` can be used to find
+out each new key. A HiLoKeyGenerator instead reserves blocks of key values
+from an allocator table and hands them out in Python as column defaults::
+
+    keys = HiLoKeyGenerator(engine, block_size=100)
+
+    orders = Table(
+        "orders",
+        metadata,
+        Column(
+            "id",
+            Integer,
+            primary_key=True,
+            autoincrement=False,
+            default=keys.sequence("orders"),
+        ),
+        ...
+    )
+
+The keys are known before the rows are inserted, so the ORM can batch the
+INSERT statements of parent and child rows alike.
+
+Each block is reserved in a short transaction of its own, on a separate
+connection. The allocator table is named ``USysSQLAlchemyKeys`` by default,
+so that Access hides it with the other system objects. It has one row for
+each sequence, holding the next value that has not been reserved. Processes
+that share the database file therefore never hand out the same key. The
+keys of a block that a process does not use are skipped.
+"""
+import threading
+
+from sqlalchemy import Column, MetaData, String, Table, exc, inspect, select
+
+from .base import LongInteger
+
+DEFAULT_TABLE_NAME = "USysSQLAlchemyKeys"
+
+
+class HiLoKeyGenerator(object):
+    def __init__(self, engine, block_size=100, table_name=DEFAULT_TABLE_NAME):
+        """
+        :param engine: the engine connected to the database that holds the
+            allocator table. It is created if it does not exist.
+        :param block_size: the number of keys reserved at a time.
+        :param table_name: the name of the allocator table.
+        """
+        self.engine = engine
+        self.block_size = block_size
+        self.table = Table(
+            table_name,
+            MetaData(),
+            Column("key_name", String(64), primary_key=True),
+            Column("next_value", LongInteger, nullable=False),
+        )
+        # key name -> [next key, end of block]
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._table_created = False
+
+    def sequence(self, key_name, start=1):
+        """
+        Return a callable for use as a column default that returns the next
+        key of the sequence ``key_name``. A new sequence starts at
+        ``start``; use a value above the existing keys of the table.
+        """
+
+        def next_key():
+            return self.next_key(key_name, start)
+
+        return next_key
+
+    def next_key(self, key_name, start=1):
+        """Return the next key of the sequence ``key_name``"""
+        with self._lock:
+            block = self._blocks.get(key_name)
+            if block is None or block[0] >= block[1]:
+                block = self._blocks[key_name] = self._reserve(key_name, start)
+            key = block[0]
+            block[0] += 1
+            return key
+
+    def _reserve(self, key_name, start):
+        """Reserve the next block of keys and return [first, end]"""
+        tbl = self.table
+        if not self._table_created:
+            try:
+                tbl.create(self.engine, checkfirst=True)
+            except exc.DBAPIError:
+                # another process may have created it after the check
+                if not inspect(self.engine).has_table(tbl.name):
+                    raise
+            self._table_created = True
+        while True:
+            try:
+                with self.engine.begin() as conn:
+                    # the UPDATE locks the row until the transaction ends,
+                    # so other processes wait for it
+                    conn.execute(
+                        tbl.update()
+                        .where(tbl.c.key_name == key_name)
+                        .values(next_value=tbl.c.next_value + self.block_size)
+                    )
+                    end = conn.scalar(
+                        select(tbl.c.next_value).where(
+                            tbl.c.key_name == key_name
+                        )
+                    )
+                    if end is None:
+                        end = start + self.block_size
+                        conn.execute(
+                            tbl.insert().values(
+                                key_name=key_name, next_value=end
+                            )
+                        )
+            except exc.IntegrityError:
+                # another process started the sequence first
+                continue
+            return [end - self.block_size, end]
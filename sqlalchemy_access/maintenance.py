@@ -0,0 +1,168 @@
+# access/maintenance.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Compact & Repair of the database file behind an engine.
+
+Access files grow as rows are deleted and temporary objects are created, and
+they only shrink when they are compacted. DatabaseMaintenance compacts the
+file with DAO's ``DBEngine.CompactDatabase``::
+
+    maintenance = DatabaseMaintenance(engine)
+    report = maintenance.compact_if_needed(threshold_policy(ratio=0.25))
+    if report.swapped:
+        print("reclaimed %d bytes" % report.free_bytes)
+
+The file is compacted into a temporary file in the same directory, which is
+then moved over the original with os.replace(). That requires exclusive
+access: the engine's pooled connections are disposed of first, and a
+DatabaseInUseError is raised if another process has the file open, either
+before compacting or just before the original is replaced, or if the file
+changed while it was being compacted.
+"""
+import collections
+import os
+
+from sqlalchemy import exc
+
+from .staging import dbLangGeneral
+
+
+class DatabaseInUseError(exc.InvalidRequestError):
+    """The database file is open in another process."""
+
+
+CompactReport = collections.namedtuple(
+    "CompactReport",
+    ["path", "file_size", "compacted_size", "free_bytes", "swapped"],
+)
+CompactReport.__doc__ = """The result of DatabaseMaintenance.compact():
+the size of the file before and after compacting, and whether the
+compacted file replaced the original."""
+
+
+def threshold_policy(ratio=0.25, min_free_bytes=1024 * 1024):
+    """
+    A policy for DatabaseMaintenance.compact_if_needed() that replaces the
+    file when compacting frees at least ``ratio`` of its size and at least
+    ``min_free_bytes``.
+    """
+
+    def policy(report):
+        return (
+            report.free_bytes >= min_free_bytes
+            and report.free_bytes >= ratio * report.file_size
+        )
+
+    return policy
+
+
+def _dispatch_dao(dao_string):
+    import win32com.client
+
+    return win32com.client.Dispatch(dao_string)
+
+
+class DatabaseMaintenance(object):
+    def __init__(self, engine, dao_factory=None):
+        """
+        :param engine: the engine connected to the database file.
+        :param dao_factory: a callable that returns a DAO DBEngine for a
+            ProgID such as "DAO.DBEngine.120". Defaults to
+            win32com.client.Dispatch.
+        """
+        self.engine = engine
+        self.dao_factory = dao_factory or _dispatch_dao
+        self._path = None
+        self._dao_string = None
+
+    def _inspect_database(self):
+        if self._path is None:
+            with self.engine.connect() as conn:
+                pyodbc_crsr = conn.connection.cursor()
+                self._dao_string = conn.dialect._get_dao_string(pyodbc_crsr)
+                self._path = conn.dialect._get_database_path(pyodbc_crsr)
+
+    @property
+    def path(self):
+        """The path of the database file."""
+        self._inspect_database()
+        return self._path
+
+    def file_size(self):
+        return os.path.getsize(self.path)
+
+    def _lock_file(self):
+        root, extension = os.path.splitext(self.path)
+        return root + (".ldb" if extension.lower() == ".mdb" else ".laccdb")
+
+    def _file_state(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _check_not_in_use(self):
+        if os.path.exists(self._lock_file()):
+            raise DatabaseInUseError(
+                "Database file '%s' is in use by another process" % self.path
+            )
+
+    def compact(self, policy=None):
+        """
+        Compact the database file into a temporary file, and replace the
+        original with it if ``policy(report)`` returns True (always, if no
+        policy is given). Returns a CompactReport. Callers must not hold
+        connections from the engine.
+        """
+        self._inspect_database()
+        path = self._path
+        self.engine.dispose()
+        self._check_not_in_use()
+        source_state = self._file_state()
+        root, extension = os.path.splitext(path)
+        temp_path = "%s.compact%s" % (root, extension)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        password = self.engine.url.password
+        locale = dbLangGeneral
+        source_connect = ""
+        if password:
+            locale += ";pwd=%s" % password
+            source_connect = ";pwd=%s" % password
+        db_engine = self.dao_factory(self._dao_string)
+        db_engine.CompactDatabase(path, temp_path, locale, 0, source_connect)
+        try:
+            file_size = os.path.getsize(path)
+            compacted_size = os.path.getsize(temp_path)
+            report = CompactReport(
+                path,
+                file_size,
+                compacted_size,
+                max(file_size - compacted_size, 0),
+                False,
+            )
+            if policy is None or policy(report):
+                # another process may have opened the file since
+                self._check_not_in_use()
+                if self._file_state() != source_state:
+                    raise DatabaseInUseError(
+                        "Database file '%s' was changed while it was being "
+                        "compacted" % path
+                    )
+                os.replace(temp_path, path)
+                report = report._replace(swapped=True)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return report
+
+    def measure(self):
+        """Compact the file into a temporary copy to measure how much space
+        compacting would free, without replacing the original."""
+        return self.compact(policy=lambda report: False)
+
+    def compact_if_needed(self, policy=None):
+        """Compact the file, replacing it only if the policy (by default,
+        threshold_policy()) finds enough free space."""
+        return self.compact(policy or threshold_policy())
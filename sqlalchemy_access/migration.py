@@ -0,0 +1,169 @@
+# access/migration.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Alembic support.
+
+Importing this module (which sqlalchemy_access does when Alembic is
+installed) registers AccessImpl, so that Alembic migrations change Access
+tables in place with Jet's own DDL:
+
+- ``add_column``, ``drop_column``, ``create_index``, ``drop_index``,
+  ``create_foreign_key``, ``create_unique_constraint`` and
+  ``drop_constraint`` are emitted as ``ALTER TABLE``, ``CREATE INDEX`` and
+  ``DROP INDEX`` statements;
+- ``alter_column`` changes of type and nullability are emitted as a single
+  ``ALTER TABLE ... ALTER COLUMN``, which needs ``existing_type`` when only
+  the nullability changes and ``existing_nullable`` when only the type
+  changes;
+- column and table renames and server default changes have no Jet DDL, so
+  they are made through DAO. They run outside of the transaction (if any) in
+  progress on the migration's connection, and are not available in offline
+  (``--sql``) mode.
+
+In batch mode the table is only copied when a column is altered to
+AutoNumber (COUNTER), which Jet does not allow on a table that has rows.
+"""
+from alembic.ddl.base import (
+    ColumnNullable,
+    ColumnType,
+    alter_table,
+    format_column_name,
+    format_server_default,
+    format_type,
+)
+from alembic.ddl.impl import DefaultImpl
+from sqlalchemy import exc
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import sqltypes
+
+from .base import COUNTER
+
+
+class AccessImpl(DefaultImpl):
+    __dialect__ = "access"
+
+    transactional_ddl = False
+
+    def requires_recreate_in_batch(self, batch_op):
+        for op, _, kw in batch_op.batch:
+            if op == "alter_column" and isinstance(
+                sqltypes.to_instance(kw.get("type_")), COUNTER
+            ):
+                return True
+        return False
+
+    def alter_column(
+        self,
+        table_name,
+        column_name,
+        nullable=None,
+        server_default=False,
+        name=None,
+        type_=None,
+        schema=None,
+        existing_type=None,
+        existing_server_default=None,
+        existing_nullable=None,
+        **kw
+    ):
+        if type_ is not None or nullable is not None:
+            # ALTER COLUMN redefines the column, so type and nullability
+            # are changed together
+            if nullable is None:
+                nullable = existing_nullable
+            self._exec(
+                ColumnNullable(
+                    table_name,
+                    column_name,
+                    nullable,
+                    schema=schema,
+                    existing_type=existing_type if type_ is None else type_,
+                )
+            )
+        if server_default is not False:
+            self._set_server_default(table_name, column_name, server_default)
+        super(AccessImpl, self).alter_column(
+            table_name,
+            column_name,
+            schema=schema,
+            existing_type=existing_type,
+            existing_server_default=existing_server_default,
+            existing_nullable=existing_nullable,
+            **kw
+        )
+        if name is not None:
+            self._rename_column(table_name, column_name, name)
+
+    def rename_table(self, old_table_name, new_table_name, schema=None):
+        db = self._get_dao_database(old_table_name, "rename_table")
+        try:
+            db.TableDefs(old_table_name).Name = new_table_name
+        finally:
+            db.Close()
+
+    def _rename_column(self, table_name, column_name, name):
+        db = self._get_dao_database(table_name, "alter_column(name=...)")
+        try:
+            db.TableDefs(table_name).Fields(column_name).Name = name
+        finally:
+            db.Close()
+
+    def _set_server_default(self, table_name, column_name, server_default):
+        db = self._get_dao_database(
+            table_name, "alter_column(server_default=...)"
+        )
+        try:
+            fld = db.TableDefs(table_name).Fields(column_name)
+            if server_default is None:
+                fld.DefaultValue = ""
+            else:
+                fld.DefaultValue = format_server_default(
+                    self.dialect.ddl_compiler(self.dialect, None),
+                    server_default,
+                )
+        finally:
+            db.Close()
+
+    def _get_dao_database(self, table_name, operation):
+        if self.as_sql:
+            raise NotImplementedError(
+                "%s is made through DAO, which is not available in "
+                "offline mode" % operation
+            )
+        return self.dialect._get_dao_database(
+            self.connection, table_name, read_only=False
+        )
+
+
+@compiles(ColumnType, "access")
+def visit_column_type(element, compiler, **kw):
+    return "%s ALTER COLUMN %s %s%s" % (
+        alter_table(compiler, element.table_name, element.schema),
+        format_column_name(compiler, element.column_name),
+        format_type(compiler, element.type_),
+        " NOT NULL" if element.existing_nullable is False else "",
+    )
+
+
+@compiles(ColumnNullable, "access")
+def visit_column_nullable(element, compiler, **kw):
+    if element.existing_type is None:
+        raise exc.CompileError(
+            "access requires existing_type to change the nullability "
+            "of column '%s'" % element.column_name
+        )
+    if element.nullable is None:
+        # ALTER COLUMN without NOT NULL would make the column nullable
+        raise exc.CompileError(
+            "access requires existing_nullable to change the type "
+            "of column '%s'" % element.column_name
+        )
+    return "%s ALTER COLUMN %s %s%s" % (
+        alter_table(compiler, element.table_name, element.schema),
+        format_column_name(compiler, element.column_name),
+        format_type(compiler, element.existing_type),
+        " NOT NULL" if element.nullable is False else "",
+    )
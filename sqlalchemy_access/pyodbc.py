@@ -21,9 +21,10 @@ Examples of pyodbc connection string URLs:
 """
 
 
-from .base import AccessExecutionContext, AccessDialect
+from .base import AccessExecutionContext, AccessDialect, QueryTimeoutError
 from sqlalchemy.connectors.pyodbc import PyODBCConnector
-from sqlalchemy import types as sqltypes, util
+from sqlalchemy import event, types as sqltypes, util
+import collections
 import decimal
 
 
@@ -93,8 +94,143 @@ class _AccessNumeric_pyodbc(sqltypes.Numeric):
         return result
 
 
+class _ReusableCursor(object):
+    """A pyodbc cursor kept in a _CursorCache. close() only releases it, so
+    that the next execution of the same SQL can reuse the statement that
+    pyodbc prepared for it."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.in_use = False
+        self.evicted = False
+        # bound once, as these are called for every execution
+        self.execute = cursor.execute
+        self.executemany = cursor.executemany
+        self.fetchone = cursor.fetchone
+        self.fetchmany = cursor.fetchmany
+        self.fetchall = cursor.fetchall
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def close(self):
+        self.in_use = False
+        if self.evicted:
+            self.cursor.close()
+
+
+class _CursorCache(object):
+    """The cursors of one pyodbc connection, by SQL, least recently used
+    first"""
+
+    def __init__(self, dbapi_connection, size):
+        self.dbapi_connection = dbapi_connection
+        self.size = size
+        self._cursors = collections.OrderedDict()
+
+    def checkout(self, key):
+        """Return a cursor for ``key`` that is not in use, creating one if
+        necessary, or None if the cached cursor is still in use."""
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            cursor = self._cursors[key] = _ReusableCursor(
+                self.dbapi_connection.cursor()
+            )
+            while len(self._cursors) > self.size:
+                self._discard(self._cursors.popitem(last=False)[1])
+        elif cursor.in_use:
+            return None
+        else:
+            self._cursors.move_to_end(key)
+        cursor.in_use = True
+        return cursor
+
+    def _discard(self, cursor):
+        cursor.evicted = True
+        if not cursor.in_use:
+            cursor.cursor.close()
+
+    def clear(self):
+        for cursor in self._cursors.values():
+            self._discard(cursor)
+        self._cursors.clear()
+
+
 class AccessExecutionContext_pyodbc(AccessExecutionContext):
-    pass
+    def create_default_cursor(self):
+        # pyodbc applies Connection.timeout (SQL_ATTR_QUERY_TIMEOUT) to the
+        # statements executed by cursors created afterwards; it must be set
+        # on the pyodbc connection itself, not on the pool's proxy
+        dbapi_connection = self._dbapi_connection
+        pyodbc_connection = dbapi_connection.dbapi_connection
+        timeout = self.execution_options.get("timeout", 0)
+        if pyodbc_connection.timeout != timeout:
+            pyodbc_connection.timeout = timeout
+        cursor = None
+        if self._use_cursor_cache():
+            cursor = self._get_cursor_cache().checkout(
+                (self.unicode_statement, timeout)
+            )
+        if cursor is None:
+            cursor = dbapi_connection.cursor()
+        # for AccessDialect_pyodbc.cancel()
+        self.root_connection.connection.info["access_active_cursor"] = cursor
+        return cursor
+
+    def _statement_completed(self):
+        # there is nothing left for AccessDialect_pyodbc.cancel() to cancel
+        self._dbapi_connection.info.pop("access_active_cursor", None)
+
+    def post_exec(self):
+        self._statement_completed()
+        super(AccessExecutionContext_pyodbc, self).post_exec()
+
+    def handle_dbapi_exception(self, e):
+        self._statement_completed()
+        super(AccessExecutionContext_pyodbc, self).handle_dbapi_exception(e)
+
+    def get_lastrowid(self):
+        if not isinstance(self.cursor, _ReusableCursor):
+            return super(AccessExecutionContext_pyodbc, self).get_lastrowid()
+        # use another cursor, so that this one keeps the INSERT prepared
+        sql = "SELECT @@identity AS lastrowid"
+        cursor = self._get_cursor_cache().checkout((sql, 0))
+        try:
+            cursor.execute(sql)
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def _use_cursor_cache(self):
+        compiled = self.compiled
+        return (
+            self.dialect.cursor_cache_size
+            and not self.isddl
+            and "unicode_statement" in self.__dict__
+            # the SQL of these changes after the cursor is created
+            and not (
+                compiled is not None
+                and (
+                    compiled.literal_execute_params
+                    or compiled.post_compile_params
+                    or compiled.schema_translate_map
+                )
+            )
+        )
+
+    def _get_cursor_cache(self):
+        info = self.root_connection.connection.info
+        cache = info.get("access_cursor_cache")
+        # the pool's proxy can stay the same while the pyodbc connection
+        # behind it is replaced, e.g., after an invalidation
+        pyodbc_connection = self._dbapi_connection.dbapi_connection
+        if cache is None or cache.dbapi_connection is not pyodbc_connection:
+            if cache is not None:
+                cache.clear()
+            cache = info["access_cursor_cache"] = _CursorCache(
+                pyodbc_connection, self.dialect.cursor_cache_size
+            )
+        return cache
 
 
 class AccessDialect_pyodbc(PyODBCConnector, AccessDialect):
@@ -109,6 +245,48 @@ class AccessDialect_pyodbc(PyODBCConnector, AccessDialect):
         AccessDialect.colspecs, {sqltypes.Numeric: _AccessNumeric_pyodbc}
     )
 
+    def __init__(self, cursor_cache_size=None, **kw):
+        """
+        :param cursor_cache_size: keep up to this many cursors open for
+            each connection, by SQL, so that statements executed again on
+            the same connection reuse the statement that pyodbc prepared
+            for them instead of being prepared by the driver again. The
+            cursors are discarded when the connection is rolled back.
+            ``None`` (the default) disables this.
+        """
+        super(AccessDialect_pyodbc, self).__init__(**kw)
+        self.cursor_cache_size = cursor_cache_size
+
+    def do_rollback(self, dbapi_connection):
+        super(AccessDialect_pyodbc, self).do_rollback(dbapi_connection)
+        # dbapi_connection is usually the pool's proxy, which has the info
+        # dict; the ad-hoc proxy used on the first connect raises
+        # NotImplementedError instead
+        try:
+            info = dbapi_connection.info
+        except (AttributeError, NotImplementedError):
+            return
+        cache = info.pop("access_cursor_cache", None)
+        if cache is not None:
+            cache.clear()
+
+    def cancel(self, connection):
+        """
+        Cancel the statement being executed on ``connection``. This can be
+        called from another thread, e.g., by a watchdog or an asyncio task
+        (see ``concurrency.execute``). Returns False if there is nothing to
+        cancel.
+        """
+        cursor = connection.connection.info.get("access_active_cursor")
+        if cursor is None:
+            return False
+        try:
+            cursor.cancel()
+        except self.dbapi.Error:
+            # the cursor has already been closed
+            return False
+        return True
+
     @classmethod
     def import_dbapi(cls):
         import pyodbc as module
@@ -117,3 +295,21 @@ class AccessDialect_pyodbc(PyODBCConnector, AccessDialect):
             False  # required for Access databases with ODBC linked tables
         )
         return module
+
+
+@event.listens_for(AccessDialect_pyodbc, "handle_error")
+def _raise_query_timeout(context):
+    """Raise QueryTimeoutError for ODBC "Timeout expired" errors"""
+    orig = context.original_exception
+    if (
+        isinstance(orig, context.dialect.dbapi.Error)
+        and orig.args
+        and orig.args[0] in ("HYT00", "HYT01")
+    ):
+        return QueryTimeoutError(
+            context.statement,
+            context.parameters,
+            orig,
+            hide_parameters=context.engine is not None
+            and context.engine.hide_parameters,
+        )
@@ -0,0 +1,111 @@
+# access/querydef.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Saved parameter queries (QueryDefs) as precompiled statements.
+
+Jet parses and optimizes ad-hoc SQL each time it is executed, but it keeps
+the optimized plan of a saved query. A SavedQuery compiles a hot statement
+once, saves it in the database with ``CREATE PROCEDURE``, and then executes
+it by name::
+
+    orders_for_customer = SavedQuery(
+        "orders_for_customer",
+        select(orders).where(orders.c.customer_id == bindparam("cust")),
+    )
+    with engine.connect() as conn:
+        rows = orders_for_customer.execute(conn, {"cust": 42}).fetchall()
+
+The saved query is named ``<name>_<digest>``, where the digest comes from
+the generated DDL. When the statement changes, a new saved query is created
+and the stale ones with the same ``<name>_`` prefix are dropped.
+"""
+import hashlib
+import threading
+import weakref
+
+from sqlalchemy import inspect
+
+from .base import AccessQueryDefCompiler
+from .ddl import CreateQueryDef, DropQueryDef
+
+
+class SavedQuery(object):
+    def __init__(self, name, statement):
+        self.name = name
+        self.statement = statement
+        self._compiled = None
+        # engine -> names of the saved queries known to exist there
+        self._materialized = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _compile(self, dialect):
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not dialect:
+            body = AccessQueryDefCompiler(dialect, self.statement)
+            ddl = str(
+                CreateQueryDef(self.name, self.statement).compile(
+                    dialect=dialect
+                )
+            )
+            digest = hashlib.md5(ddl.encode("utf-8")).hexdigest()[:8]
+            compiled = self._compiled = (
+                dialect,
+                body,
+                "%s_%s" % (self.name, digest),
+            )
+        return compiled[1], compiled[2]
+
+    def materialize(self, connection):
+        """
+        Create the saved query in the database if it does not exist, and
+        drop stale versions of it. Returns the saved query's name.
+        """
+        _, querydef_name = self._compile(connection.dialect)
+        with self._lock:
+            known = self._materialized.setdefault(connection.engine, set())
+            if querydef_name in known:
+                return querydef_name
+            # use a separate connection so that the DDL is committed
+            # independently of any transaction in progress on connection
+            with connection.engine.begin() as ddl_conn:
+                existing = inspect(ddl_conn).get_view_names()
+                for view_name in existing:
+                    if (
+                        view_name.startswith(self.name + "_")
+                        and view_name != querydef_name
+                        and len(view_name) == len(querydef_name)
+                    ):
+                        ddl_conn.execute(DropQueryDef(view_name))
+                if querydef_name not in existing:
+                    ddl_conn.execute(
+                        CreateQueryDef(querydef_name, self.statement)
+                    )
+            known.add(querydef_name)
+        return querydef_name
+
+    def execute(self, connection, parameters=None):
+        """
+        Execute the saved query with EXEC, creating it first if necessary.
+        ``parameters`` override the values of the statement's bound
+        parameters, as for Connection.execute().
+        """
+        querydef_name = self.materialize(connection)
+        body, _ = self._compile(connection.dialect)
+        params = body.construct_params(parameters)
+        processors = body._bind_processors
+        values = []
+        for name in body.querydef_parameters:
+            value = params[name]
+            if name in processors:
+                value = processors[name](value)
+            values.append(value)
+        sql = "EXEC " + connection.dialect.identifier_preparer.quote(
+            querydef_name
+        )
+        if values:
+            sql += " " + ", ".join("?" for _ in values)
+            return connection.exec_driver_sql(sql, tuple(values))
+        return connection.exec_driver_sql(sql)
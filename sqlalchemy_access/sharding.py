@@ -0,0 +1,265 @@
+# access/sharding.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Horizontal sharding of a table across several Access database files.
+
+A ShardedTable spreads the rows of one logical table over a list of database
+files, according to a RangeStrategy or HashStrategy on a key column. That
+keeps each file below the 2 GB limit of the Access database format::
+
+    orders = Table(
+        "orders",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("amount", Currency),
+    )
+    sharded = ShardedTable(
+        engine,
+        orders,
+        [r"C:\\data\\orders_0.accdb", r"C:\\data\\orders_1.accdb"],
+        RangeStrategy("id", [1000000]),
+    )
+    sharded.create_shards()
+    sharded.insert(rows)
+    rows = sharded.fetch_parallel(
+        lambda tbl: select(tbl).where(tbl.c.amount > 100)
+    )
+
+Writes are routed to an engine connected to the shard's own file. Reads can
+fan out over those engines in parallel, or be pushed down to ``engine`` as a
+single UNION ALL over the shards, which refers to each shard's file with
+Jet's ``[;DATABASE=<path>]`` table prefix.
+"""
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    and_,
+    func,
+    not_,
+    select,
+    true,
+    union_all,
+)
+
+from .staging import create_database, create_database_engine
+
+
+class RangeStrategy(object):
+    """
+    Assign rows to shards by ranges of a key column. ``bounds`` holds the
+    lower bound of every shard except the first one, in ascending order.
+    """
+
+    def __init__(self, key, bounds):
+        self.key = key
+        self.bounds = list(bounds)
+
+    @property
+    def shard_count(self):
+        return len(self.bounds) + 1
+
+    def shard_for(self, value):
+        return bisect.bisect_right(self.bounds, value)
+
+    def criteria(self, column, shard):
+        clauses = []
+        if shard > 0:
+            clauses.append(column >= self.bounds[shard - 1])
+        if shard < len(self.bounds):
+            clauses.append(column < self.bounds[shard])
+        return and_(*clauses) if clauses else true()
+
+
+class HashStrategy(object):
+    """
+    Assign rows to shards by the absolute value of an integer key column
+    modulo the number of shards, which Jet evaluates as ``Abs(key) MOD n``.
+    Python's ``%`` and Jet's ``MOD`` disagree on the sign of the result for
+    negative keys, so both work on the absolute value.
+    """
+
+    def __init__(self, key, shard_count):
+        self.key = key
+        self.shard_count = shard_count
+
+    def shard_for(self, value):
+        if not isinstance(value, int) or isinstance(value, bool):
+            # Jet's MOD rounds other numbers to integers first
+            raise ValueError(
+                "HashStrategy requires integer keys, not %r" % (value,)
+            )
+        return abs(value) % self.shard_count
+
+    def criteria(self, column, shard):
+        return func.abs(column) % self.shard_count == shard
+
+
+class ShardedTable(object):
+    def __init__(self, engine, table, databases, strategy):
+        if len(databases) != strategy.shard_count:
+            raise ValueError(
+                "strategy defines %d shards but %d databases were given"
+                % (strategy.shard_count, len(databases))
+            )
+        self.engine = engine
+        self.table = table
+        self.databases = list(databases)
+        self.strategy = strategy
+        self._engines = {}
+        # fetch_parallel() gets the engines from its worker threads
+        self._engines_lock = threading.Lock()
+        self._remote_tables = {}
+
+    def _connection_string(self, path):
+        with self.engine.connect() as conn:
+            return conn.dialect._get_odbc_connection_string(
+                conn.connection.cursor(), path
+            )
+
+    def shard_engine(self, shard):
+        """The engine connected to the database file of shard ``shard``."""
+        return self._get_engine(self.databases[shard])
+
+    def _get_engine(self, path):
+        with self._engines_lock:
+            if path not in self._engines:
+                self._engines[path] = create_database_engine(
+                    self._connection_string(path)
+                )
+            return self._engines[path]
+
+    def remote_table(self, shard):
+        """
+        A copy of the table that refers to the shard's database file with
+        Jet's ``[;DATABASE=<path>]`` prefix, for use in statements executed
+        on ``engine``.
+        """
+        path = self.databases[shard]
+        if path not in self._remote_tables:
+            self._remote_tables[path] = Table(
+                self.table.name,
+                MetaData(),
+                *[
+                    Column(col.name, col.type, primary_key=col.primary_key)
+                    for col in self.table.columns
+                ],
+                access_database=path
+            )
+        return self._remote_tables[path]
+
+    def create_shards(self):
+        """Create missing shard files and the table in each of them."""
+        for shard, path in enumerate(self.databases):
+            if not os.path.exists(path):
+                create_database(self.engine, path)
+            self.table.create(self.shard_engine(shard), checkfirst=True)
+
+    def insert(self, rows):
+        """Insert a list of dicts, each one into the shard that owns it."""
+        by_shard = {}
+        for row in rows:
+            shard = self.strategy.shard_for(row[self.strategy.key])
+            by_shard.setdefault(shard, []).append(row)
+        for shard, shard_rows in sorted(by_shard.items()):
+            with self.shard_engine(shard).begin() as conn:
+                conn.execute(self.table.insert(), shard_rows)
+
+    def execute_all(self, statement_factory):
+        """
+        Execute the statement returned by ``statement_factory(table)`` in
+        each shard (e.g., an UPDATE or DELETE), one shard at a time.
+        """
+        rowcount = 0
+        for shard in range(len(self.databases)):
+            with self.shard_engine(shard).begin() as conn:
+                result = conn.execute(statement_factory(self.table))
+                if result.rowcount > 0:
+                    rowcount += result.rowcount
+        return rowcount
+
+    def fetch_parallel(self, statement_factory, key=None):
+        """
+        Execute the SELECT returned by ``statement_factory(table)`` in every
+        shard in parallel and return the combined rows, sorted by ``key`` if
+        specified.
+        """
+
+        def fetch(shard):
+            with self.shard_engine(shard).connect() as conn:
+                return conn.execute(statement_factory(self.table)).fetchall()
+
+        with ThreadPoolExecutor(max_workers=len(self.databases)) as executor:
+            results = executor.map(fetch, range(len(self.databases)))
+            rows = [row for shard_rows in results for row in shard_rows]
+        if key is not None:
+            rows.sort(key=key)
+        return rows
+
+    def union_all(self, statement_factory=None):
+        """
+        A UNION ALL of the shards for execution on ``engine``.
+        ``statement_factory(table)`` can return a SELECT to push down to each
+        shard. By default, all rows and columns are selected.
+        """
+        if statement_factory is None:
+            statement_factory = select
+        return union_all(
+            *[
+                statement_factory(self.remote_table(shard))
+                for shard in range(len(self.databases))
+            ]
+        )
+
+    def rebalance(self, strategy, databases=None):
+        """
+        Move rows so that they are placed according to ``strategy`` (and,
+        optionally, a new list of ``databases``). Rows are moved by one
+        INSERT ... SELECT and one DELETE per shard, executed by the engine
+        connected to the source shard.
+        """
+        old_databases = self.databases
+        new_databases = list(databases or old_databases)
+        if len(new_databases) != strategy.shard_count:
+            raise ValueError(
+                "strategy defines %d shards but %d databases were given"
+                % (strategy.shard_count, len(new_databases))
+            )
+        self.databases = new_databases
+        self.create_shards()
+        key = self.table.c[strategy.key]
+        for path in old_databases:
+            with self._get_engine(path).begin() as conn:
+                keep = None
+                for new_shard, new_path in enumerate(new_databases):
+                    criteria = strategy.criteria(key, new_shard)
+                    if new_path == path:
+                        keep = criteria
+                        continue
+                    conn.execute(
+                        self.remote_table(new_shard)
+                        .insert()
+                        .from_select(
+                            [col.name for col in self.table.columns],
+                            select(self.table).where(criteria),
+                        )
+                    )
+                if keep is None:
+                    conn.execute(self.table.delete())
+                else:
+                    conn.execute(self.table.delete().where(not_(keep)))
+        self.strategy = strategy
+
+    def dispose(self):
+        with self._engines_lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
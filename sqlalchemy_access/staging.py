@@ -0,0 +1,183 @@
+# access/staging.py
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""
+Staging tables in a scratch database file.
+
+Access has no temporary tables, and creating and dropping work tables in the
+main database file bloats it until it is compacted. A StagingDatabase creates
+its tables in a separate, throwaway database file instead. The tables it
+returns carry the ``access_database`` option, so statements executed on the
+main engine reference them via Jet's ``[;DATABASE=<path>]`` table prefix,
+e.g.::
+
+    with StagingDatabase(engine) as staging:
+        stg = staging.table(
+            "stg_orders",
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("amount", Currency),
+        )
+        with engine.begin() as conn:
+            conn.execute(stg.insert(), rows)
+            conn.execute(
+                orders.insert().from_select(
+                    ["id", "amount"], select(stg.c.id, stg.c.amount)
+                )
+            )
+
+A CTE that a report references several times can be materialized once
+with ``staging.materialize(conn, cte)`` and the returned table used in its
+place.
+
+The scratch file is deleted when the StagingDatabase is closed.
+"""
+import os
+import tempfile
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, create_engine, select
+from sqlalchemy.engine import URL
+from sqlalchemy.sql.selectable import CTE
+
+try:
+    import win32com.client
+except ImportError:  # pywin32 is only available on Windows
+    win32com = None
+
+# DAO constants
+dbLangGeneral = ";LANGID=0x0409;CP=1252;COUNTRY=0"
+dbVersion40 = 64
+dbVersion120 = 128
+
+
+def create_database(engine, path):
+    """
+    Create an empty database file at ``path``, using the DAO version that
+    matches the engine's ODBC driver, and return the ODBC connection string
+    for it.
+    """
+    with engine.connect() as conn:
+        pyodbc_crsr = conn.connection.cursor()
+        dao_string = conn.dialect._get_dao_string(pyodbc_crsr)
+        connection_string = conn.dialect._get_odbc_connection_string(
+            pyodbc_crsr, path
+        )
+    if dao_string == "DAO.DBEngine.36":
+        version = dbVersion40
+    else:
+        version = dbVersion120
+    db_engine = win32com.client.Dispatch(dao_string)
+    db_engine.CreateDatabase(path, dbLangGeneral, version).Close()
+    return connection_string
+
+
+def create_database_engine(connection_string, **kw):
+    """Create an Access engine from an ODBC connection string."""
+    return create_engine(
+        URL.create("access+pyodbc", query={"odbc_connect": connection_string}),
+        **kw
+    )
+
+
+class StagingDatabase(object):
+    def __init__(self, engine, path=None):
+        self.engine = engine
+        self.path = path
+        self.metadata = MetaData()
+        self.scratch_engine = None
+
+    def create(self):
+        """Create the scratch database file and an engine connected to it."""
+        if self.path is None:
+            with self.engine.connect() as conn:
+                pyodbc_crsr = conn.connection.cursor()
+                dao_string = conn.dialect._get_dao_string(pyodbc_crsr)
+            extension = ".mdb" if dao_string == "DAO.DBEngine.36" else ".accdb"
+            self.path = os.path.join(
+                tempfile.gettempdir(),
+                "sqla_staging_%s%s" % (uuid.uuid4().hex, extension),
+            )
+        self.scratch_engine = create_database_engine(
+            create_database(self.engine, self.path)
+        )
+        return self
+
+    def table(self, name, *args, **kw):
+        """Create a staging table and return its Table object."""
+        if self.scratch_engine is None:
+            raise RuntimeError("The staging database has not been created")
+        kw["access_database"] = self.path
+        table = Table(name, self.metadata, *args, **kw)
+        table.create(self.scratch_engine)
+        return table
+
+    def materialize(self, connection, selectable, name=None):
+        """
+        Save the rows of ``selectable`` (a Select or CTE) into a new staging
+        table by executing INSERT ... SELECT on ``connection``, and return
+        the table. A CTE that is referenced many times can be replaced by
+        the returned table so that Jet evaluates its query only once. The
+        staging table is named after the CTE unless ``name`` is given.
+        """
+        if isinstance(selectable, CTE):
+            name = name or selectable.name
+            selectable = selectable.element
+        if name is None:
+            raise ValueError("A name is required for the staging table")
+        table = self.table(
+            name,
+            *[
+                Column(col.name, col.type)
+                for col in selectable.selected_columns
+            ]
+        )
+        connection.execute(
+            table.insert().from_select(
+                [col.name for col in table.columns], selectable
+            )
+        )
+        return table
+
+    def in_(self, column, values):
+        """
+        Load ``values`` into a new staging table and return the predicate
+        ``column IN (SELECT value FROM <staging table>)``, for filter lists
+        that are too long to be rendered into the statement itself.
+        """
+        table = self.table(
+            "stg_in_%s" % uuid.uuid4().hex[:8],
+            Column(
+                "value", column.type, primary_key=True, autoincrement=False
+            ),
+        )
+        with self.scratch_engine.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [{"value": value} for value in dict.fromkeys(values)],
+            )
+        return column.in_(select(table.c.value))
+
+    def drop_table(self, table):
+        table.drop(self.scratch_engine)
+        self.metadata.remove(table)
+
+    def close(self):
+        """Dispose of the scratch engine and delete the scratch file."""
+        if self.scratch_engine is not None:
+            self.scratch_engine.dispose()
+            self.scratch_engine = None
+        if self.path is not None:
+            root, extension = os.path.splitext(self.path)
+            lock_file = root + (".ldb" if extension == ".mdb" else ".laccdb")
+            for file_path in (self.path, lock_file):
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+        self.metadata.clear()
+
+    def __enter__(self):
+        return self.create()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
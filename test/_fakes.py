@@ -0,0 +1,342 @@
+"""
+Fake pyodbc and DAO objects, for tests that run without an Access database.
+
+A FakeDatabaseFile holds the tables of one database file. Its connect()
+returns a FakeConnection, which stands in for a pyodbc connection both for
+executing statements and for the ODBC catalog functions used by reflection.
+fake_dao() makes DAO's OpenDatabase(), and pyodbc.connect() for other
+database files, open FakeDatabaseFiles, and fake_engine() creates an engine
+whose pyodbc connection is a FakeConnection.
+"""
+
+import collections
+import contextlib
+import types
+from unittest import mock
+
+from sqlalchemy import create_engine, pool
+
+from sqlalchemy_access import base
+
+TableRow = collections.namedtuple(
+    "TableRow",
+    ["table_cat", "table_schem", "table_name", "table_type", "remarks"],
+)
+ColumnRow = collections.namedtuple(
+    "ColumnRow",
+    [
+        "column_name",
+        "type_name",
+        "column_size",
+        "decimal_digits",
+        "nullable",
+        "column_def",
+    ],
+)
+StatisticsRow = collections.namedtuple(
+    "StatisticsRow", ["index_name", "non_unique", "column_name"]
+)
+ProcedureRow = collections.namedtuple("ProcedureRow", ["procedure_name"])
+DAOField = collections.namedtuple("DAOField", ["Name", "ForeignName"])
+Execution = collections.namedtuple(
+    "Execution", ["statement", "parameters", "timeout"]
+)
+
+
+class FakeDBAPIError(Exception):
+    pass
+
+
+class FakeProgrammingError(FakeDBAPIError):
+    pass
+
+
+class FakeIndex(object):
+    """An index, as reported by ODBC's statistics and by DAO"""
+
+    def __init__(
+        self,
+        name,
+        columns,
+        primary=False,
+        unique=False,
+        foreign=False,
+        required=False,
+        ignore_nulls=False,
+    ):
+        self.Name = name
+        self.Fields = [DAOField(column, None) for column in columns]
+        self.Primary = primary
+        self.Unique = unique or primary
+        self.Foreign = foreign
+        self.Required = required or primary
+        self.IgnoreNulls = ignore_nulls
+
+
+class FakeRelation(object):
+    """A DAO Relation; ``foreign_table(foreign_columns)`` references
+    ``table(columns)``"""
+
+    def __init__(self, name, table, columns, foreign_table, foreign_columns):
+        self.Name = name
+        self.Table = table
+        self.ForeignTable = foreign_table
+        self.Fields = [
+            DAOField(column, foreign_column)
+            for column, foreign_column in zip(columns, foreign_columns)
+        ]
+
+
+class FakeTable(object):
+    def __init__(
+        self,
+        name,
+        columns,
+        indexes=(),
+        record_count=0,
+        connect="",
+        table_type="TABLE",
+    ):
+        """
+        :param columns: (name, ODBC type name, size, nullable) tuples.
+        :param connect: the connect string of a linked table.
+        """
+        self.name = name
+        self.columns = [
+            ColumnRow(column_name, type_name, size, None, nullable, None)
+            for column_name, type_name, size, nullable in columns
+        ]
+        self.indexes = list(indexes)
+        self.record_count = record_count
+        self.connect = connect
+        self.table_type = table_type
+
+
+class FakeDatabaseFile(object):
+    def __init__(self, path, tables=(), relations=(), procedures=()):
+        self.path = path
+        self.tables = collections.OrderedDict(
+            (table.name, table) for table in tables
+        )
+        self.relations = list(relations)
+        self.procedures = list(procedures)
+        self.connections = []
+        self.dao_databases = []
+
+    def connect(self):
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        return connection
+
+
+class FakeCursor(object):
+    arraysize = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.closed = False
+        self._rows = []
+
+    def execute(self, statement, parameters=()):
+        connection = self.connection
+        connection.executed.append(
+            Execution(statement, parameters, connection.timeout)
+        )
+        if connection.error is not None:
+            raise connection.error
+        if connection.blocking is not None:
+            connection.blocking.wait()
+        self.description, rows = connection.results.get(statement, (None, []))
+        self._rows = list(rows)
+        self.rowcount = connection.rowcount
+        return self
+
+    def executemany(self, statement, parameters):
+        self.connection.executed.append(
+            Execution(statement, list(parameters), self.connection.timeout)
+        )
+        self.rowcount = self.connection.rowcount
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def _catalog(self, rows):
+        self.description = None
+        self._rows = list(rows)
+        return self
+
+    def tables(self, table=None, tableType=None):
+        database_file = self.connection.database_file
+        return self._catalog(
+            TableRow(database_file.path, None, tbl.name, tbl.table_type, None)
+            for tbl in database_file.tables.values()
+            if (table is None or tbl.name == table)
+            and (tableType is None or tbl.table_type == tableType)
+        )
+
+    def columns(self, table):
+        return self._catalog(
+            self.connection.database_file.tables[table].columns
+        )
+
+    def statistics(self, table):
+        # the first row describes the table itself
+        rows = [StatisticsRow(None, None, None)]
+        for idx in self.connection.database_file.tables[table].indexes:
+            rows.extend(
+                StatisticsRow(idx.Name, 0 if idx.Unique else 1, fld.Name)
+                for fld in idx.Fields
+            )
+        return self._catalog(rows)
+
+    def procedures(self):
+        return self._catalog(
+            ProcedureRow(name)
+            for name in self.connection.database_file.procedures
+        )
+
+    def cancel(self):
+        self.connection.cancelled += 1
+        if self.connection.blocking is not None:
+            self.connection.blocking.set()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection(object):
+    """A pyodbc connection; ``timeout`` stands for SQL_ATTR_QUERY_TIMEOUT"""
+
+    def __init__(self, database_file=None, driver_name="ACEODBC.DLL"):
+        self.database_file = database_file or FakeDatabaseFile(
+            r"C:\data\fake.accdb"
+        )
+        self.driver_name = driver_name
+        self.timeout = 0
+        self.rowcount = 1
+        # statement -> (description, rows)
+        self.results = {}
+        self.executed = []
+        self.cursors = []
+        self.error = None
+        self.blocking = None
+        self.cancelled = 0
+        self.closed = False
+        self._converters = {}
+
+    def cursor(self):
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def getinfo(self, info_type):
+        if info_type == base.pyodbc.SQL_DRIVER_NAME:
+            return self.driver_name
+        return "04.00.0000"
+
+    def get_output_converter(self, sql_type):
+        return self._converters.get(sql_type)
+
+    def add_output_converter(self, sql_type, converter):
+        self._converters[sql_type] = converter
+
+    def rollback(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDAODatabase(object):
+    def __init__(self, database_file, read_only):
+        self.database_file = database_file
+        self.read_only = read_only
+        self.Relations = database_file.relations
+        self.closed = False
+
+    def TableDefs(self, table_name):
+        table = self.database_file.tables[table_name]
+        return types.SimpleNamespace(
+            Name=table.name,
+            Indexes=table.indexes,
+            RecordCount=table.record_count,
+            Connect=table.connect,
+        )
+
+    def Close(self):
+        self.closed = True
+
+
+class FakeDBEngine(object):
+    def __init__(self, database_files):
+        self.database_files = database_files
+        self.opened = []
+
+    def OpenDatabase(self, path, exclusive, read_only, connect):
+        self.opened.append((path, exclusive, read_only, connect))
+        database_file = self.database_files[path]
+        db = FakeDAODatabase(database_file, read_only)
+        database_file.dao_databases.append(db)
+        return db
+
+
+@contextlib.contextmanager
+def fake_dao(*database_files):
+    """Make DAO, and pyodbc.connect() for reflecting other database files,
+    open the given FakeDatabaseFiles. Yields the FakeDBEngine."""
+    by_path = {
+        database_file.path: database_file for database_file in database_files
+    }
+    db_engine = FakeDBEngine(by_path)
+
+    def connect(connection_string):
+        attributes = dict(
+            part.split("=", 1) for part in connection_string.split(";") if part
+        )
+        return by_path[attributes["DBQ"]].connect()
+
+    win32com = types.SimpleNamespace(
+        client=types.SimpleNamespace(Dispatch=lambda prog_id: db_engine)
+    )
+    with mock.patch.object(base, "win32com", win32com):
+        with mock.patch.object(base.pyodbc, "connect", connect, create=True):
+            yield db_engine
+
+
+fake_dbapi = types.SimpleNamespace(
+    Error=FakeDBAPIError,
+    ProgrammingError=FakeProgrammingError,
+    paramstyle="qmark",
+    version="5.0.0",
+    SQL_DBMS_VER=18,
+)
+
+
+def fake_engine(connect=FakeConnection, **kw):
+    """An engine over the fake DBAPI; ``connect`` returns its pyodbc
+    connections"""
+    return create_engine(
+        "access+pyodbc://@fake_dsn",
+        module=fake_dbapi,
+        creator=connect,
+        poolclass=pool.StaticPool,
+        **kw
+    )
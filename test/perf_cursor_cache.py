@@ -0,0 +1,81 @@
+"""
+Benchmark for the ``cursor_cache_size`` dialect option.
+
+Executes the same parameterized SELECT and UPDATE many times on one
+connection, with and without the cursor cache, and prints the time per
+execution. Without the cache, each execution gets a new cursor, so the
+Access ODBC driver prepares the statement again every time.
+
+Run it against a scratch database, e.g.::
+
+    python test/perf_cursor_cache.py "access+pyodbc://@my_test_dsn" 5000
+"""
+
+import sys
+import time
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    create_engine,
+    select,
+)
+
+metadata = MetaData()
+perf_table = Table(
+    "perf_cursor_cache",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("txt", String(50)),
+)
+ROWS = 100
+
+
+def run(url, iterations, cursor_cache_size):
+    engine = create_engine(url, cursor_cache_size=cursor_cache_size)
+    select_stmt = select(perf_table.c.txt).where(
+        perf_table.c.id == bindparam("id")
+    )
+    update_stmt = (
+        perf_table.update()
+        .where(perf_table.c.id == bindparam("id"))
+        .values(txt=bindparam("txt"))
+    )
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        for i in range(iterations):
+            conn.execute(select_stmt, {"id": i % ROWS}).fetchall()
+            conn.execute(update_stmt, {"id": i % ROWS, "txt": "row %d" % i})
+        elapsed = time.perf_counter() - start
+        conn.commit()
+    engine.dispose()
+    return elapsed / (2 * iterations)
+
+
+def main(url, iterations=2000):
+    engine = create_engine(url)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            perf_table.insert(),
+            [{"id": i, "txt": "row %d" % i} for i in range(ROWS)],
+        )
+    engine.dispose()
+    try:
+        uncached = run(url, iterations, None)
+        cached = run(url, iterations, 10)
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
+    print("without cursor cache: %8.1f us per execution" % (uncached * 1e6))
+    print("with cursor cache:    %8.1f us per execution" % (cached * 1e6))
+    print("prepare overhead saved: %.0f%%" % (100 * (1 - cached / uncached)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], *[int(arg) for arg in sys.argv[2:3]])
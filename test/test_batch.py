@@ -0,0 +1,150 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table, bindparam
+from sqlalchemy.testing import eq_, fixtures, is_
+
+from sqlalchemy_access.base import AccessDialect
+from sqlalchemy_access.batch import SCRATCH_TABLE_PREFIX, batch_statements
+
+from ._fakes import FakeConnection
+
+
+class FakeContext(object):
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.isupdate = compiled.isupdate
+        self.isdelete = compiled.isdelete
+        self._rowcount = None
+
+
+class BatchStatementsTest(fixtures.TestBase):
+    def _table(self):
+        return Table(
+            "batch_t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(20)),
+        )
+
+    def _compile(self, dialect, stmt, keys):
+        return stmt.compile(dialect=dialect, column_keys=keys)
+
+    def test_update(self):
+        dialect = AccessDialect(paramstyle="qmark")
+        tbl = self._table()
+        batch = batch_statements(
+            dialect,
+            self._compile(
+                dialect,
+                tbl.update().where(tbl.c.id == bindparam("b_id")),
+                ["txt", "b_id"],
+            ),
+        )
+        scratch = "[%s]" % batch.table_name
+        assert batch.table_name.startswith(SCRATCH_TABLE_PREFIX)
+        eq_(
+            batch.insert_sql,
+            "INSERT INTO %s (batch_id, p0, p1) VALUES (?, ?, ?)" % scratch,
+        )
+        eq_(batch.positions, (0, 1))
+        eq_(
+            batch.apply_sql,
+            "UPDATE batch_t INNER JOIN {s} ON batch_t.id = {s}.p1 "
+            "SET batch_t.txt={s}.p0 "
+            "WHERE batch_t.id = {s}.p1 AND {s}.batch_id = ?".format(s=scratch),
+        )
+
+    def test_delete(self):
+        dialect = AccessDialect(paramstyle="qmark")
+        tbl = self._table()
+        batch = batch_statements(
+            dialect,
+            self._compile(
+                dialect,
+                tbl.delete().where(tbl.c.id == bindparam("b_id")),
+                ["b_id"],
+            ),
+        )
+        eq_(
+            batch.apply_sql,
+            "DELETE DISTINCTROW batch_t.* FROM batch_t INNER JOIN {s} "
+            "ON batch_t.id = {s}.p0 "
+            "WHERE batch_t.id = {s}.p0 AND {s}.batch_id = ?".format(
+                s="[%s]" % batch.table_name
+            ),
+        )
+
+    def test_no_join_condition(self):
+        dialect = AccessDialect(paramstyle="qmark")
+        tbl = self._table()
+        is_(
+            batch_statements(
+                dialect,
+                self._compile(
+                    dialect,
+                    tbl.update().values(txt=bindparam("b_txt")),
+                    ["b_txt"],
+                ),
+            ),
+            None,
+        )
+
+
+class DoExecutemanyTest(fixtures.TestBase):
+    def _run(self, threshold, rows):
+        dialect = AccessDialect(
+            paramstyle="qmark", executemany_batch_threshold=threshold
+        )
+        tbl = Table(
+            "batch_t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(20)),
+        )
+        compiled = (
+            tbl.update()
+            .where(tbl.c.id == bindparam("b_id"))
+            .compile(dialect=dialect, column_keys=["txt", "b_id"])
+        )
+        connection = FakeConnection()
+        context = FakeContext(compiled)
+        dialect.do_executemany(
+            connection.cursor(), compiled.string, rows, context
+        )
+        return dialect, connection, context
+
+    def test_sane_multi_rowcount(self):
+        eq_(AccessDialect().supports_sane_multi_rowcount, False)
+        eq_(
+            AccessDialect(
+                executemany_batch_threshold=10
+            ).supports_sane_multi_rowcount,
+            True,
+        )
+
+    def test_small_batch_adds_up_rowcount(self):
+        _, connection, context = self._run(10, [("a", 1), ("b", 2)])
+        eq_(len(connection.executed), 2)
+        eq_(context._rowcount, 2)
+
+    def test_large_batch_uses_scratch_table(self):
+        dialect, connection, context = self._run(2, [("a", 1), ("b", 2)])
+        statements = [sql.statement for sql in connection.executed]
+        assert statements[0].strip().startswith("CREATE TABLE")
+        assert statements[1].startswith("INSERT INTO")
+        assert statements[2].startswith("UPDATE batch_t INNER JOIN")
+        assert statements[3].startswith("DELETE FROM")
+        batch_id = connection.executed[2].parameters[0]
+        eq_(
+            connection.executed[1].parameters,
+            [(batch_id, "a", 1), (batch_id, "b", 2)],
+        )
+        eq_(context._rowcount, 1)
+
+        # the scratch table is created only once
+        connection.executed[:] = []
+        dialect.do_executemany(
+            connection.cursor(),
+            context.compiled.string,
+            [("c", 3), ("d", 4)],
+            context,
+        )
+        eq_(len(connection.executed), 3)
@@ -0,0 +1,146 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+from sqlalchemy import event, func, inspect, select, Table, testing
+from sqlalchemy.testing import eq_, fixtures
+
+from ._fakes import (
+    fake_dao,
+    fake_engine,
+    FakeDatabaseFile,
+    FakeIndex,
+    FakeTable,
+)
+
+
+class IndexReflectionTest(fixtures.TestBase):
+    def test_constraint_indexes_are_marked_as_duplicates(self):
+        # a table with a primary key, a relation and an index of its own
+        database_file = FakeDatabaseFile(
+            r"C:\data\child.accdb",
+            [
+                FakeTable(
+                    "child",
+                    [],
+                    indexes=[
+                        FakeIndex("PrimaryKey", ["id"], primary=True),
+                        FakeIndex(
+                            "fk_child_parent", ["parent_id"], foreign=True
+                        ),
+                        FakeIndex("ix_child_txt", ["txt"], ignore_nulls=True),
+                    ],
+                )
+            ],
+        )
+        with fake_dao(database_file):
+            indexes = {
+                idx["name"]: idx
+                for idx in inspect(
+                    fake_engine(database_file.connect)
+                ).get_indexes("child")
+            }
+        eq_(indexes["PrimaryKey"]["duplicates_constraint"], "PrimaryKey")
+        eq_(
+            indexes["fk_child_parent"]["duplicates_constraint"],
+            "fk_child_parent",
+        )
+        eq_(
+            indexes["ix_child_txt"],
+            {
+                "name": "ix_child_txt",
+                "unique": False,
+                "column_names": ["txt"],
+                "dialect_options": {"access_with": "IGNORE NULL"},
+            },
+        )
+
+
+class BulkLoadTest(fixtures.TablesTest):
+    @testing.provide_metadata
+    def test_bulk_load_recreates_indexes(self, connection):
+        parent = Table(
+            "bulk_parent",
+            self.metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+        )
+        child = Table(
+            "bulk_child",
+            self.metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column(
+                "parent_id",
+                Integer,
+                ForeignKey("bulk_parent.id", name="fk_bulk_child_parent"),
+            ),
+            Column("txt", String(50)),
+            Index("ix_bulk_child_txt", "txt", access_with="IGNORE NULL"),
+        )
+        self.metadata.create_all(connection)
+        connection.execute(parent.insert(), [{"id": 1}])
+
+        with connection.dialect.bulk_load(connection, "bulk_child"):
+            eq_(inspect(connection).get_foreign_keys("bulk_child"), [])
+            connection.execute(
+                child.insert(),
+                [{"id": i, "parent_id": 1, "txt": None} for i in range(100)],
+            )
+
+        insp = inspect(connection)
+        eq_(
+            [fk["name"] for fk in insp.get_foreign_keys("bulk_child")],
+            ["fk_bulk_child_parent"],
+        )
+        indexes = {idx["name"]: idx for idx in insp.get_indexes("bulk_child")}
+        eq_(
+            indexes["ix_bulk_child_txt"]["dialect_options"],
+            {"access_with": "IGNORE NULL"},
+        )
+
+    @testing.provide_metadata
+    def test_truncate_table_recreates_without_duplicate_indexes(
+        self, connection
+    ):
+        Table(
+            "trunc_parent",
+            self.metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+        )
+        child = Table(
+            "trunc_child",
+            self.metadata,
+            Column("id", Integer, primary_key=True),
+            Column(
+                "parent_id",
+                Integer,
+                ForeignKey("trunc_parent.id", name="fk_trunc_child_parent"),
+            ),
+            Column("txt", String(50)),
+            Index("ix_trunc_child_txt", "txt"),
+        )
+        self.metadata.create_all(connection)
+        connection.execute(child.insert(), [{"txt": "a"}, {"txt": "b"}])
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        connection.dialect.truncate_table(connection, "trunc_child")
+        event.remove(connection, "before_cursor_execute", capture)
+
+        eq_(
+            [
+                stmt.strip().split("(")[0].strip()
+                for stmt in statements
+                if stmt.lstrip().startswith("CREATE")
+            ],
+            [
+                "CREATE TABLE trunc_child",
+                "CREATE INDEX ix_trunc_child_txt ON trunc_child",
+            ],
+        )
+        insp = inspect(connection)
+        eq_(
+            [fk["name"] for fk in insp.get_foreign_keys("trunc_child")],
+            ["fk_trunc_child_parent"],
+        )
+        eq_(connection.scalar(select(func.count()).select_from(child)), 0)
@@ -0,0 +1,175 @@
+from sqlalchemy import Column, event, Integer, MetaData, String, Table
+from sqlalchemy import func, select, testing
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.orm import aliased, declarative_base, Session
+from sqlalchemy.testing import eq_, fixtures, is_, is_not
+
+from sqlalchemy_access.cache import _CachingCursor, ResultCache
+
+from ._fakes import fake_engine, FakeConnection, FakeDatabaseFile, FakeTable
+
+
+class StatementCacheTest(fixtures.TablesTest):
+    @testing.provide_metadata
+    def test_repeated_orm_queries_hit_cache(self, connection):
+        Base = declarative_base(metadata=self.metadata)
+
+        class Thing(Base):
+            __tablename__ = "cache_test"
+            id = Column(Integer, primary_key=True, autoincrement=False)
+            txt = Column(String(50))
+
+        Base.metadata.create_all(connection)
+        connection.execute(
+            Thing.__table__.insert(),
+            [{"id": 1, "txt": "foo"}, {"id": 2, "txt": "bar"}],
+        )
+
+        cache_hits = []
+
+        @event.listens_for(connection, "after_cursor_execute")
+        def after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            cache_hits.append(context.cache_hit is CACHE_HIT)
+
+        session = Session(connection)
+        for id_ in (1, 2, 1, 2):
+            other = aliased(Thing)
+            stmt = (
+                select(Thing.txt, func.length(other.txt))
+                .join_from(Thing, other, Thing.id == other.id)
+                .where(Thing.id != id_)
+            )
+            session.execute(stmt).fetchall()
+        session.close()
+
+        # only the first execution compiles the statement
+        eq_(cache_hits, [False, True, True, True])
+
+
+class ResultCacheTest(fixtures.TestBase):
+    description = (("id", int, None, 10, 10, 0, False),)
+
+    def test_hit_returns_rows(self):
+        cache = ResultCache()
+        is_(cache.get("q1"), None)
+        cache.put("q1", [(None, "t")], self.description, [(1,), (2,)])
+        cursor = cache.get("q1")
+        eq_(cursor.description, self.description)
+        eq_(cursor.fetchone(), (1,))
+        eq_(cursor.fetchall(), [(2,)])
+        eq_((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("q1", [], self.description, [(1,)])
+        cache.put("q2", [], self.description, [(2,)])
+        cache.get("q1")
+        cache.put("q3", [], self.description, [(3,)])
+        is_not(cache.get("q1"), None)
+        is_(cache.get("q2"), None)
+        is_not(cache.get("q3"), None)
+
+    def test_large_results_are_not_cached(self):
+        cache = ResultCache(max_rows=1)
+        cache.put("q1", [], self.description, [(1,), (2,)])
+        is_(cache.get("q1"), None)
+
+    def test_invalidate_by_table(self):
+        cache = ResultCache()
+        cache.put("q1", [(None, "t1")], self.description, [(1,)])
+        cache.put("q2", [(None, "t2")], self.description, [(2,)])
+        cache.invalidate([(None, "t1")])
+        is_(cache.get("q1"), None)
+        is_not(cache.get("q2"), None)
+
+    def test_file_change_clears(self, tmp_path):
+        path = tmp_path / "db.accdb"
+        path.write_bytes(b"x")
+        cache = ResultCache()
+        cache.database_path = str(path)
+        cache.put("q1", [], self.description, [(1,)])
+        is_not(cache.get("q1"), None)
+        path.write_bytes(b"xy")
+        is_(cache.get("q1"), None)
+
+
+class CachingCursorTest(fixtures.TestBase):
+    description = (("id", int, None, 10, 10, 0, False),)
+
+    def _cursor(self, cache, rows):
+        connection = FakeConnection()
+        connection.results["q1"] = (self.description, [(row,) for row in rows])
+        return _CachingCursor(
+            cache, "q1", [(None, "t")], connection.cursor().execute("q1")
+        )
+
+    def test_rows_are_stored_once_fetched(self):
+        cache = ResultCache()
+        cursor = self._cursor(cache, [1, 2, 3])
+        eq_(cursor.description, self.description)
+        eq_(cursor.fetchone(), (1,))
+        eq_(cache._entries, {})
+        eq_(cursor.fetchmany(5), [(2,), (3,)])
+        eq_(cache.get("q1").fetchall(), [(1,), (2,), (3,)])
+
+    def test_nothing_is_fetched_ahead(self):
+        cache = ResultCache()
+        cursor = self._cursor(cache, [1, 2, 3])
+        eq_(cursor.fetchone(), (1,))
+        eq_(cursor._cursor._rows, [(2,), (3,)])
+
+    def test_closed_early_is_not_stored(self):
+        cache = ResultCache()
+        cursor = self._cursor(cache, [1, 2, 3])
+        eq_(cursor.fetchmany(2), [(1,), (2,)])
+        cursor.close()
+        is_(cursor._cursor.closed, True)
+        is_(cache.get("q1"), None)
+
+    def test_large_result_is_not_collected(self):
+        cache = ResultCache(max_rows=2)
+        cursor = self._cursor(cache, [1, 2, 3, 4])
+        eq_(cursor.fetchmany(3), [(1,), (2,), (3,)])
+        is_(cursor._rows, None)
+        eq_(cursor.fetchall(), [(4,)])
+        is_(cache.get("q1"), None)
+
+    def test_invalidated_while_fetching_is_not_stored(self):
+        cache = ResultCache()
+        cursor = self._cursor(cache, [1, 2])
+        eq_(cursor.fetchone(), (1,))
+        cache.invalidate([(None, "t")])
+        eq_(cursor.fetchall(), [(2,)])
+        is_(cache.get("q1"), None)
+
+
+class EngineResultCacheTest(fixtures.TestBase):
+    description = (("x", int, None, 10, 10, 0, True),)
+
+    def test_hit_does_not_open_cursor(self):
+        database_file = FakeDatabaseFile(
+            r"C:\data\cache.accdb",
+            [FakeTable("t", [("x", "INTEGER", 10, True)])],
+        )
+        cache = ResultCache()
+        engine = fake_engine(database_file.connect, result_cache=cache)
+        t = Table("t", MetaData(), Column("x", Integer))
+        stmt = select(t.c.x).where(t.c.x > 0)
+        with engine.connect() as conn:
+            pyodbc_connection = conn.connection.dbapi_connection
+            sql = "SELECT t.x \nFROM t \nWHERE t.x > ?"
+            pyodbc_connection.results[sql] = (self.description, [(1,), (2,)])
+            eq_(conn.execute(stmt).fetchall(), [(1,), (2,)])
+            cursors = len(pyodbc_connection.cursors)
+            eq_(conn.execute(stmt).fetchall(), [(1,), (2,)])
+            eq_(len(pyodbc_connection.cursors), cursors)
+            # a different parameter value is a miss
+            conn.execute(select(t.c.x).where(t.c.x > 1)).fetchall()
+            eq_(len(pyodbc_connection.cursors), cursors + 1)
+        eq_(
+            [sql.parameters for sql in pyodbc_connection.executed],
+            [(0,), (1,)],
+        )
+        eq_((cache.hits, cache.misses), (1, 2))
@@ -0,0 +1,636 @@
+import uuid
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    bindparam,
+    delete,
+    distinct,
+    func,
+    select,
+    update,
+)
+from sqlalchemy import exc
+from sqlalchemy.schema import CreateIndex, CreateTable, DropIndex
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing.assertions import (
+    AssertsCompiledSQL,
+    assert_raises_message,
+    eq_,
+)
+
+from sqlalchemy_access import crosstab, merge
+from sqlalchemy_access.base import GUID, AccessDialect
+from sqlalchemy_access.ddl import AlterCounter, CreateQueryDef, DropQueryDef
+
+
+class ExternalDatabaseTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _tables(self):
+        metadata = MetaData()
+        local = Table(
+            "local_t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+        )
+        other = Table(
+            "other_t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+            access_database=r"C:\Temp\other.accdb",
+        )
+        return local, other
+
+    def test_select_from_external_table(self):
+        local, other = self._tables()
+        self.assert_compile(
+            select(other.c.txt).where(other.c.id == 1),
+            "SELECT other_t.txt "
+            "FROM [;DATABASE=C:\\Temp\\other.accdb].other_t "
+            "WHERE other_t.id = :id_1",
+        )
+
+    def test_insert_select_into_external_table(self):
+        local, other = self._tables()
+        self.assert_compile(
+            other.insert().from_select(
+                ["id", "txt"], select(local.c.id, local.c.txt)
+            ),
+            "INSERT INTO [;DATABASE=C:\\Temp\\other.accdb].other_t (id, txt) "
+            "SELECT local_t.id, local_t.txt FROM local_t",
+        )
+
+    def test_join_with_external_table(self):
+        local, other = self._tables()
+        self.assert_compile(
+            select(local.c.txt, other.c.txt).select_from(
+                local.join(other, local.c.id == other.c.id)
+            ),
+            "SELECT local_t.txt, other_t.txt AS txt_1 FROM (local_t "
+            "INNER JOIN [;DATABASE=C:\\Temp\\other.accdb].other_t "
+            "ON local_t.id = other_t.id)",
+        )
+
+    def test_tables_in_two_external_databases(self):
+        local, other = self._tables()
+        third = Table(
+            "third_t",
+            local.metadata,
+            Column("id", Integer, primary_key=True),
+            access_database=r"C:\Temp\third.accdb",
+        )
+        self.assert_compile(
+            select(other.c.id).where(other.c.id == third.c.id),
+            "SELECT other_t.id "
+            "FROM [;DATABASE=C:\\Temp\\other.accdb].other_t, "
+            "[;DATABASE=C:\\Temp\\third.accdb].third_t "
+            "WHERE other_t.id = third_t.id",
+        )
+
+    def test_update_external_table(self):
+        local, other = self._tables()
+        self.assert_compile(
+            update(other).where(other.c.id == 1).values(txt="x"),
+            "UPDATE [;DATABASE=C:\\Temp\\other.accdb].other_t "
+            "SET txt=:txt WHERE other_t.id = :id_1",
+        )
+
+    def test_delete_from_external_table(self):
+        local, other = self._tables()
+        self.assert_compile(
+            delete(other).where(other.c.id == 1),
+            "DELETE FROM [;DATABASE=C:\\Temp\\other.accdb].other_t "
+            "WHERE other_t.id = :id_1",
+        )
+
+
+class QueryDefTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def test_create_querydef(self):
+        tbl = Table(
+            "qd_t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+        )
+        stmt = (
+            select(tbl.c.txt)
+            .where(tbl.c.id == bindparam("id_", type_=Integer))
+            .limit(10)
+        )
+        self.assert_compile(
+            CreateQueryDef("qd_select", stmt),
+            "CREATE PROCEDURE qd_select ([prm_id_] INTEGER) AS "
+            "SELECT TOP 10 qd_t.txt FROM qd_t WHERE qd_t.id = [prm_id_]",
+        )
+
+    def test_drop_querydef(self):
+        self.assert_compile(
+            DropQueryDef("qd_select"), "DROP PROCEDURE qd_select"
+        )
+
+
+class MergeTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _tables(self):
+        metadata = MetaData()
+        target = Table(
+            "merge_target",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+        )
+        source = Table(
+            "merge_source",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+        )
+        return target, source
+
+    def test_merge(self):
+        target, source = self._tables()
+        self.assert_compile(
+            merge(target, source, on=["id"]),
+            "UPDATE merge_target RIGHT JOIN merge_source "
+            "ON merge_target.id = merge_source.id "
+            "SET merge_target.id = merge_source.id, "
+            "merge_target.txt = merge_source.txt",
+        )
+
+    def test_merge_paired(self):
+        target, source = self._tables()
+        update_stmt, insert_stmt = merge(target, source, on=["id"]).paired()
+        self.assert_compile(
+            update_stmt,
+            "UPDATE merge_target INNER JOIN merge_source "
+            "ON merge_target.id = merge_source.id "
+            "SET merge_target.txt = merge_source.txt",
+        )
+        self.assert_compile(
+            insert_stmt,
+            "INSERT INTO merge_target (id, txt) "
+            "SELECT merge_source.id, merge_source.txt "
+            "FROM (merge_source LEFT OUTER JOIN merge_target "
+            "ON merge_target.id = merge_source.id) "
+            "WHERE merge_target.id IS NULL",
+        )
+
+    def test_merge_paired_onclause_without_primary_key(self):
+        metadata = MetaData()
+        target = Table("merge_target", metadata, Column("code", String(10)))
+        source = Table("merge_source", metadata, Column("code", String(10)))
+        _, insert_stmt = merge(
+            target, source, on=target.c.code == source.c.code
+        ).paired()
+        self.assert_compile(
+            insert_stmt,
+            "INSERT INTO merge_target (code) "
+            "SELECT merge_source.code "
+            "FROM (merge_source LEFT OUTER JOIN merge_target "
+            "ON merge_target.code = merge_source.code) "
+            "WHERE merge_target.code IS NULL",
+        )
+
+    def test_merge_paired_needs_target_column(self):
+        metadata = MetaData()
+        target = Table("merge_target", metadata, Column("code", String(10)))
+        source = Table("merge_source", metadata, Column("code", String(10)))
+        stmt = merge(target, source, on=source.c.code.is_not(None))
+        assert_raises_message(
+            exc.ArgumentError, "has no primary key", stmt.paired
+        )
+
+
+class MultiTableDMLTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _tables(self):
+        metadata = MetaData()
+        parent = Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+            Column("child_id", Integer),
+        )
+        child = Table(
+            "child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+            Column("grandchild_id", Integer),
+        )
+        grandchild = Table(
+            "grandchild",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+        )
+        return parent, child, grandchild
+
+    def test_update_join(self):
+        parent, child, _ = self._tables()
+        self.assert_compile(
+            update(parent)
+            .where(parent.c.child_id == child.c.id)
+            .values(txt=child.c.txt),
+            "UPDATE parent INNER JOIN child ON parent.child_id = child.id "
+            "SET parent.txt=child.txt WHERE parent.child_id = child.id",
+        )
+
+    def test_update_nested_joins(self):
+        parent, child, grandchild = self._tables()
+        self.assert_compile(
+            update(parent)
+            .where(child.c.grandchild_id == grandchild.c.id)
+            .where(parent.c.child_id == child.c.id)
+            .values(txt=grandchild.c.txt),
+            "UPDATE (parent INNER JOIN child "
+            "ON parent.child_id = child.id) "
+            "INNER JOIN grandchild ON child.grandchild_id = grandchild.id "
+            "SET parent.txt=grandchild.txt "
+            "WHERE child.grandchild_id = grandchild.id "
+            "AND parent.child_id = child.id",
+        )
+
+    def test_delete_join(self):
+        parent, child, _ = self._tables()
+        self.assert_compile(
+            delete(parent)
+            .where(parent.c.child_id == child.c.id)
+            .where(child.c.txt == "x"),
+            "DELETE DISTINCTROW parent.* FROM parent INNER JOIN child "
+            "ON parent.child_id = child.id "
+            "WHERE parent.child_id = child.id AND child.txt = :txt_1",
+        )
+
+    def test_unrelated_table_raises(self):
+        parent, child, _ = self._tables()
+        assert_raises_message(
+            exc.CompileError,
+            "Access requires a WHERE condition",
+            self.assert_compile,
+            update(parent).where(child.c.txt == "x").values(txt=child.c.txt),
+            "",
+        )
+
+
+class CrosstabTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _table(self):
+        return Table(
+            "sales",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("region", String(20)),
+            Column("quarter", String(2)),
+            Column("amount", Integer),
+        )
+
+    def test_crosstab(self):
+        sales = self._table()
+        self.assert_compile(
+            crosstab(
+                func.sum(sales.c.amount),
+                select(sales.c.region).group_by(sales.c.region),
+                sales.c.quarter,
+            ),
+            "TRANSFORM sum(sales.amount) SELECT sales.region FROM sales "
+            "GROUP BY sales.region PIVOT sales.quarter",
+        )
+
+    def test_crosstab_in(self):
+        sales = self._table()
+        self.assert_compile(
+            crosstab(
+                func.sum(sales.c.amount),
+                select(sales.c.region)
+                .where(sales.c.amount > 0)
+                .group_by(sales.c.region),
+                sales.c.quarter,
+                in_=["Q1", "Q2"],
+            ),
+            "TRANSFORM sum(sales.amount) SELECT sales.region FROM sales "
+            "WHERE sales.amount > :amount_1 GROUP BY sales.region "
+            "PIVOT sales.quarter IN ('Q1', 'Q2')",
+        )
+
+
+class CTETest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _tables(self):
+        metadata = MetaData()
+        emp = Table(
+            "emp",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("dept_id", Integer),
+            Column("salary", Integer),
+        )
+        dept = Table(
+            "dept",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50)),
+        )
+        return emp, dept
+
+    def test_cte_inlined_in_join(self):
+        emp, dept = self._tables()
+        totals = (
+            select(emp.c.dept_id, func.sum(emp.c.salary).label("total"))
+            .group_by(emp.c.dept_id)
+            .cte("totals")
+        )
+        self.assert_compile(
+            select(dept.c.name, totals.c.total).join_from(
+                dept, totals, dept.c.id == totals.c.dept_id
+            ),
+            "SELECT dept.name, totals.total FROM (dept INNER JOIN "
+            "(SELECT emp.dept_id AS dept_id, sum(emp.salary) AS total "
+            "FROM emp GROUP BY emp.dept_id) AS totals "
+            "ON dept.id = totals.dept_id)",
+        )
+
+    def test_nested_ctes(self):
+        emp, _ = self._tables()
+        high = select(emp.c.id).where(emp.c.salary > 5).cte("high")
+        higher = select(high.c.id).where(high.c.id > 3).cte("higher")
+        self.assert_compile(
+            select(higher),
+            "SELECT higher.id FROM (SELECT high.id AS id FROM "
+            "(SELECT emp.id AS id FROM emp WHERE emp.salary > :salary_1) "
+            "AS high WHERE high.id > :id_1) AS higher",
+        )
+
+    def test_recursive_cte_raises(self):
+        emp, _ = self._tables()
+        cte = select(emp.c.id).cte("r", recursive=True)
+        assert_raises_message(
+            exc.CompileError,
+            "Access does not support recursive common table expressions",
+            self.assert_compile,
+            select(cte),
+            "",
+        )
+
+
+class DistinctAggregateTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _table(self):
+        return Table(
+            "emp",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("dept_id", Integer),
+            Column("salary", Integer),
+        )
+
+    def test_count_distinct(self):
+        emp = self._table()
+        self.assert_compile(
+            select(func.count(distinct(emp.c.salary))),
+            "SELECT count(anon_1.salary_1) AS count_1 FROM "
+            "(SELECT DISTINCT emp.salary AS salary_1 FROM emp) AS anon_1",
+        )
+
+    def test_grouped_distinct_aggregates(self):
+        emp = self._table()
+        self.assert_compile(
+            select(
+                emp.c.dept_id,
+                func.count(distinct(emp.c.salary)).label("n"),
+                func.sum(emp.c.salary.distinct()).label("total"),
+            )
+            .where(emp.c.id > 3)
+            .group_by(emp.c.dept_id)
+            .order_by(emp.c.dept_id),
+            "SELECT anon_1.dept_id_1 AS dept_id, count(anon_1.salary_1) AS n, "
+            "sum(anon_1.salary_1) AS total FROM "
+            "(SELECT DISTINCT emp.dept_id AS dept_id_1, "
+            "emp.salary AS salary_1 FROM emp WHERE emp.id > :id_1) AS anon_1 "
+            "GROUP BY anon_1.dept_id_1 ORDER BY anon_1.dept_id_1",
+        )
+
+    def test_mixed_aggregates_raise(self):
+        emp = self._table()
+        assert_raises_message(
+            exc.CompileError,
+            "Access cannot emulate aggregates over DISTINCT together "
+            "with other aggregates",
+            self.assert_compile,
+            select(
+                emp.c.dept_id,
+                func.count(distinct(emp.c.salary)),
+                func.max(emp.c.salary),
+            ).group_by(emp.c.dept_id),
+            "",
+        )
+
+    def test_distinct_aggregate_in_expression_raises(self):
+        emp = self._table()
+        assert_raises_message(
+            exc.CompileError,
+            "Access can only emulate aggregates over DISTINCT that are "
+            "selected on their own",
+            self.assert_compile,
+            select(func.sum(distinct(emp.c.salary)) + 1),
+            "",
+        )
+
+    def test_distinct_aggregate_in_scalar_subquery(self):
+        emp = self._table()
+        self.assert_compile(
+            select(
+                emp.c.id,
+                select(func.count(distinct(emp.c.salary)))
+                .scalar_subquery()
+                .label("n"),
+            ),
+            "SELECT emp.id, (SELECT count(anon_1.salary_1) AS count_1 FROM "
+            "(SELECT DISTINCT emp.salary AS salary_1 FROM emp) AS anon_1) "
+            "AS n FROM emp",
+        )
+
+    def test_distinct_aggregate_in_correlated_subquery_raises(self):
+        metadata = MetaData()
+        parent = Table("parent", metadata, Column("id", Integer))
+        child = Table(
+            "child",
+            metadata,
+            Column("parent_id", Integer),
+            Column("x", Integer),
+        )
+        stmt = select(
+            parent.c.id,
+            select(func.count(distinct(child.c.x)))
+            .where(child.c.parent_id == parent.c.id)
+            .scalar_subquery()
+            .label("n"),
+        )
+        assert_raises_message(
+            exc.CompileError,
+            "correlated subquery",
+            stmt.compile,
+            dialect=AccessDialect(),
+        )
+
+
+class LargeInListTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _expanded(self, values):
+        tbl = Table(
+            "in_t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+        )
+        compiled = (
+            select(tbl.c.id)
+            .where(tbl.c.id.in_(values))
+            .compile(dialect=AccessDialect())
+        )
+        return compiled.construct_expanded_state()
+
+    def test_short_in_list_uses_parameters(self):
+        state = self._expanded([1, 2, 3])
+        eq_(
+            state.statement,
+            "SELECT in_t.id \nFROM in_t \n"
+            "WHERE in_t.id IN (:id_1_1, :id_1_2, :id_1_3)",
+        )
+
+    def test_long_in_list_uses_literals(self):
+        values = list(range(300))
+        state = self._expanded(values)
+        eq_(
+            state.statement,
+            "SELECT in_t.id \nFROM in_t \nWHERE in_t.id IN (%s)"
+            % ", ".join(str(value) for value in values),
+        )
+        eq_(state.parameters, {})
+
+    def test_in_list_over_statement_limit_raises(self):
+        assert_raises_message(
+            exc.CompileError,
+            r"IN list of 20000 values .* StagingDatabase.in_\(\)",
+            self._expanded,
+            list(range(10000000, 10020000)),
+        )
+
+
+class IndexWithTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _table(self):
+        return Table(
+            "ix_t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("txt", String(50)),
+        )
+
+    def test_create_index_with(self):
+        tbl = self._table()
+        self.assert_compile(
+            CreateIndex(Index("ix_txt", tbl.c.txt, access_with="IGNORE NULL")),
+            "CREATE INDEX ix_txt ON ix_t (txt) WITH IGNORE NULL",
+        )
+
+    def test_create_index_without_with(self):
+        tbl = self._table()
+        self.assert_compile(
+            CreateIndex(Index("ix_txt", tbl.c.txt, unique=True)),
+            "CREATE UNIQUE INDEX ix_txt ON ix_t (txt)",
+        )
+
+    def test_create_index_bad_with_raises(self):
+        tbl = self._table()
+        assert_raises_message(
+            exc.CompileError,
+            "access_with must be one of",
+            self.assert_compile,
+            CreateIndex(Index("ix_txt", tbl.c.txt, access_with="NULLS")),
+            "",
+        )
+
+    def test_drop_index(self):
+        tbl = self._table()
+        self.assert_compile(
+            DropIndex(Index("ix_txt", tbl.c.txt)),
+            "DROP INDEX ix_txt ON ix_t",
+        )
+
+
+class AlterCounterTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def test_alter_counter(self):
+        tbl = Table(
+            "counter_t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+        )
+        self.assert_compile(
+            AlterCounter(tbl.c.id),
+            "ALTER TABLE counter_t ALTER COLUMN id COUNTER(1, 1)",
+        )
+
+
+class GUIDTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    value = uuid.UUID("0f8fad5b-d9cb-469f-a165-70867728950e")
+
+    def _processors(self, type_):
+        dialect = AccessDialect()
+        impl = type_.dialect_impl(dialect)
+        return (
+            impl.bind_processor(dialect),
+            impl.result_processor(dialect, None),
+        )
+
+    def test_generic_uuid_renders_guid(self):
+        tbl = Table("guid_t", MetaData(), Column("id", Uuid))
+        self.assert_compile(
+            CreateTable(tbl), "CREATE TABLE guid_t (id GUID NULL)"
+        )
+
+    def test_literal(self):
+        tbl = Table("guid_t", MetaData(), Column("id", GUID))
+        self.assert_compile(
+            select(tbl).where(tbl.c.id == self.value),
+            "SELECT guid_t.id FROM guid_t WHERE guid_t.id = "
+            "{guid {0f8fad5b-d9cb-469f-a165-70867728950e}}",
+            literal_binds=True,
+        )
+
+    def test_as_uuid(self):
+        bind, result = self._processors(GUID())
+        eq_(bind(self.value), "{%s}" % self.value)
+        eq_(bind(None), None)
+        eq_(result("{0F8FAD5B-D9CB-469F-A165-70867728950E}"), self.value)
+        eq_(result(self.value.bytes_le), self.value)
+        eq_(result(self.value), self.value)
+        eq_(result(None), None)
+
+    def test_as_string(self):
+        bind, result = self._processors(Uuid(as_uuid=False))
+        eq_(bind(str(self.value)), "{%s}" % self.value)
+        eq_(bind("{%s}" % self.value), "{%s}" % self.value)
+        eq_(result("{0F8FAD5B-D9CB-469F-A165-70867728950E}"), str(self.value))
+        eq_(result(self.value.bytes_le), str(self.value))
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.testing import eq_, fixtures, is_
+from sqlalchemy.testing.assertions import assert_raises
+
+from sqlalchemy_access.base import QueryTimeoutError
+from sqlalchemy_access.concurrency import execute
+
+from ._fakes import fake_engine, FakeConnection, FakeDBAPIError
+
+
+class TimeoutTest(fixtures.TestBase):
+    def setup_test(self):
+        self.pyodbc_connection = FakeConnection()
+        self.engine = fake_engine(lambda: self.pyodbc_connection)
+
+    def test_timeout_is_set_on_pyodbc_connection(self):
+        with self.engine.connect() as conn:
+            conn.execute(text("UPDATE t SET x=1").execution_options(timeout=5))
+            conn.execute(text("UPDATE t SET x=2"))
+        eq_(
+            [
+                (sql.statement, sql.timeout)
+                for sql in self.pyodbc_connection.executed
+            ],
+            [("UPDATE t SET x=1", 5), ("UPDATE t SET x=2", 0)],
+        )
+
+    def test_timeout_expired_raises_query_timeout_error(self):
+        with self.engine.connect() as conn:
+            for sqlstate in ("HYT00", "HYT01"):
+                self.pyodbc_connection.error = FakeDBAPIError(
+                    sqlstate, "[Microsoft][ODBC Driver] Timeout expired"
+                )
+                assert_raises(
+                    QueryTimeoutError,
+                    conn.execute,
+                    text("UPDATE t SET x=1").execution_options(timeout=1),
+                )
+
+    def test_other_errors_are_not_timeouts(self):
+        self.pyodbc_connection.error = FakeDBAPIError("42000", "Syntax error")
+        with self.engine.connect() as conn:
+            try:
+                conn.execute(text("UPDATE t SET x=1"))
+            except Exception as err:
+                assert not isinstance(err, QueryTimeoutError)
+            else:
+                assert False, "no error raised"
+
+    def test_cancel(self):
+        self.pyodbc_connection.blocking = threading.Event()
+        with self.engine.connect() as conn:
+            is_(self.engine.dialect.cancel(conn), False)
+            thread = threading.Thread(
+                target=conn.execute, args=(text("UPDATE t SET x=1"),)
+            )
+            thread.start()
+            while not self.pyodbc_connection.executed:
+                thread.join(0.01)
+            is_(self.engine.dialect.cancel(conn), True)
+            thread.join()
+            # the statement has completed
+            is_(self.engine.dialect.cancel(conn), False)
+        eq_(self.pyodbc_connection.cancelled, 1)
+
+    def test_cancelled_task_cancels_statement(self):
+        self.pyodbc_connection.blocking = threading.Event()
+
+        async def run(conn):
+            await asyncio.wait_for(
+                execute(conn, text("UPDATE t SET x=1")), timeout=0.1
+            )
+
+        with self.engine.connect() as conn:
+            assert_raises(asyncio.TimeoutError, asyncio.run, run(conn))
+        eq_(self.pyodbc_connection.cancelled, 1)
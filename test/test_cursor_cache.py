@@ -0,0 +1,86 @@
+from sqlalchemy import text
+from sqlalchemy.testing import eq_, fixtures, is_
+
+from sqlalchemy_access.pyodbc import AccessDialect_pyodbc, _CursorCache
+
+from ._fakes import fake_engine, FakeConnection, FakeDatabaseFile
+
+
+class CursorCacheTest(fixtures.TestBase):
+    def test_reuse(self):
+        conn = FakeConnection()
+        cache = _CursorCache(conn, 2)
+        first = cache.checkout("SELECT 1")
+        first.close()
+        is_(cache.checkout("SELECT 1"), first)
+        eq_(len(conn.cursors), 1)
+        assert not conn.cursors[0].closed
+
+    def test_in_use(self):
+        cache = _CursorCache(FakeConnection(), 2)
+        cache.checkout("SELECT 1")
+        is_(cache.checkout("SELECT 1"), None)
+
+    def test_lru_eviction(self):
+        conn = FakeConnection()
+        cache = _CursorCache(conn, 2)
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 1"):
+            cache.checkout(sql).close()
+        in_use = cache.checkout("SELECT 3")
+        # "SELECT 2" was the least recently used
+        eq_([cursor.closed for cursor in conn.cursors], [False, True, False])
+        cache.checkout("SELECT 4")
+        assert conn.cursors[0].closed
+        # a cursor that is evicted while in use is closed when released
+        cache.clear()
+        assert not conn.cursors[2].closed
+        in_use.close()
+        assert conn.cursors[2].closed
+
+    def test_rollback_clears(self):
+        dialect = AccessDialect_pyodbc(cursor_cache_size=10)
+        conn = FakeConnection()
+        # do_rollback() is given the pool's proxy, which has the info dict
+        conn.info = {}
+        cache = conn.info["access_cursor_cache"] = _CursorCache(conn, 10)
+        cache.checkout("SELECT 1").close()
+        dialect.do_rollback(conn)
+        assert "access_cursor_cache" not in conn.info
+        assert conn.cursors[0].closed
+
+
+class CursorCacheEngineTest(fixtures.TestBase):
+    def setup_test(self):
+        self.database_file = FakeDatabaseFile(r"C:\data\cursors.accdb")
+        self.engine = fake_engine(
+            self.database_file.connect, cursor_cache_size=10
+        )
+
+    def test_cursor_is_reused(self):
+        with self.engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("UPDATE t SET x = :x"), {"x": i})
+            cache = conn.connection.info["access_cursor_cache"]
+            # keyed on the pyodbc connection, not on the pool's proxy
+            is_(cache.dbapi_connection, self.database_file.connections[-1])
+        eq_(len(self.database_file.connections[-1].cursors), 1)
+
+    def test_replaced_cache_is_cleared(self):
+        with self.engine.connect() as conn:
+            info = conn.connection.info
+            stale = info["access_cursor_cache"] = _CursorCache(
+                FakeConnection(), 10
+            )
+            stale.checkout("SELECT 1").close()
+            conn.execute(text("UPDATE t SET x = 1"))
+            is_(
+                info["access_cursor_cache"].dbapi_connection,
+                self.database_file.connections[0],
+            )
+        assert stale.dbapi_connection.cursors[0].closed
+
+    def test_idle_cached_cursor_is_not_cancelled(self):
+        with self.engine.connect() as conn:
+            conn.execute(text("UPDATE t SET x = 1"))
+            is_(self.engine.dialect.cancel(conn), False)
+        eq_(self.database_file.connections[0].cancelled, 0)
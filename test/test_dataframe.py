@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy.testing import eq_, fixtures
+
+from sqlalchemy_access import Byte, Integer, LongInteger, LongText, ShortText
+from sqlalchemy_access.dataframe import infer_access_types
+
+
+class InferAccessTypesTest(fixtures.TestBase):
+    def _infer(self, data):
+        pd = pytest.importorskip("pandas")
+        dtypes = infer_access_types(pd.DataFrame(data))
+        return {
+            name: (type(type_), getattr(type_, "length", None))
+            for name, type_ in dtypes.items()
+        }
+
+    def test_text_columns(self):
+        eq_(
+            self._infer(
+                {
+                    "short": ["a", "abc", None],
+                    "long": ["x" * 256, "y", "z"],
+                    "mixed": ["a", 1, None],
+                }
+            ),
+            {"short": (ShortText, 3), "long": (LongText, None)},
+        )
+
+    def test_integer_columns(self):
+        eq_(
+            self._infer(
+                {
+                    "byte": [0, 255],
+                    "smallint": [-1, 255],
+                    "integer": [0, 2**15],
+                    "too_big": [0, 2**31],
+                    "floats": [0.5, 1.0],
+                }
+            ),
+            {
+                "byte": (Byte, None),
+                "smallint": (Integer, None),
+                "integer": (LongInteger, None),
+            },
+        )
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import threading
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.testing import eq_, fixtures
+
+from sqlalchemy_access.keygen import HiLoKeyGenerator
+
+
+class HiLoKeyGeneratorTest(fixtures.TestBase):
+    # the allocator only uses generic SQL, so SQLite stands in for Access
+
+    def setup_test(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.engines = []
+
+    def teardown_test(self):
+        for engine in self.engines:
+            engine.dispose()
+        os.remove(self.path)
+
+    def _engine(self):
+        engine = create_engine("sqlite:///%s" % self.path)
+        self.engines.append(engine)
+        return engine
+
+    def test_blocks(self):
+        engine = self._engine()
+        keys = HiLoKeyGenerator(engine, block_size=3)
+        next_order = keys.sequence("orders", start=10)
+        eq_([next_order() for _ in range(7)], list(range(10, 17)))
+        eq_([keys.next_key("items") for _ in range(2)], [1, 2])
+        with engine.connect() as conn:
+            eq_(
+                dict(
+                    conn.execute(
+                        select(keys.table.c.key_name, keys.table.c.next_value)
+                    ).fetchall()
+                ),
+                {"orders": 19, "items": 4},
+            )
+
+    def test_generators_share_the_table(self):
+        engine = self._engine()
+        first = HiLoKeyGenerator(engine, block_size=5)
+        second = HiLoKeyGenerator(engine, block_size=5)
+        eq_(
+            [first.next_key("t"), second.next_key("t"), first.next_key("t")],
+            [1, 6, 2],
+        )
+
+    def test_threads(self):
+        keys = HiLoKeyGenerator(self._engine(), block_size=7)
+        results = []
+
+        def worker():
+            results.extend(keys.next_key("t") for _ in range(50))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        eq_(sorted(results), list(range(1, 201)))
+
+    def test_table_created_by_another_process(self):
+        engine = self._engine()
+        keys = HiLoKeyGenerator(engine)
+        other = HiLoKeyGenerator(self._engine())
+
+        @event.listens_for(keys.table, "before_create")
+        def create_first(target, connection, **kw):
+            # the other generator creates the table after the check
+            eq_(other.next_key("t"), 1)
+
+        eq_(keys.next_key("t"), 101)
@@ -0,0 +1,143 @@
+import contextlib
+import os
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.testing import eq_, fixtures, is_
+from sqlalchemy.testing.assertions import assert_raises
+
+from sqlalchemy_access.maintenance import (
+    DatabaseInUseError,
+    DatabaseMaintenance,
+    threshold_policy,
+)
+
+
+class FakeDialect(object):
+    def __init__(self, path):
+        self.path = path
+
+    def _get_dao_string(self, crsr):
+        return "DAO.DBEngine.120"
+
+    def _get_database_path(self, crsr):
+        return self.path
+
+
+class FakeConnection(object):
+    def __init__(self, path):
+        self.dialect = FakeDialect(path)
+        self.connection = self
+
+    def cursor(self):
+        return None
+
+
+class FakeEngine(object):
+    url = make_url("access+pyodbc://@fake_dsn")
+
+    def __init__(self, path):
+        self.path = path
+        self.disposed = False
+
+    @contextlib.contextmanager
+    def connect(self):
+        yield FakeConnection(self.path)
+
+    def dispose(self):
+        self.disposed = True
+
+
+class FakeDBEngine(object):
+    """Compacts a file by writing the given number of bytes to the copy"""
+
+    def __init__(self, compacted_size):
+        self.compacted_size = compacted_size
+
+    def CompactDatabase(self, src, dst, locale, options, password):
+        with open(dst, "wb") as f:
+            f.write(b"c" * self.compacted_size)
+
+
+class ConcurrentWriterDBEngine(FakeDBEngine):
+    """Compacts a file while another process opens and writes to it"""
+
+    def __init__(self, compacted_size, lock):
+        super(ConcurrentWriterDBEngine, self).__init__(compacted_size)
+        self.lock = lock
+
+    def CompactDatabase(self, src, dst, locale, options, password):
+        super(ConcurrentWriterDBEngine, self).CompactDatabase(
+            src, dst, locale, options, password
+        )
+        if self.lock:
+            open(os.path.splitext(src)[0] + ".laccdb", "wb").close()
+        with open(src, "ab") as f:
+            f.write(b"w")
+
+
+class CompactTest(fixtures.TestBase):
+    def _maintenance(self, tmp_path, file_size, compacted_size):
+        path = str(tmp_path / "db.accdb")
+        with open(path, "wb") as f:
+            f.write(b"o" * file_size)
+        engine = FakeEngine(path)
+        maintenance = DatabaseMaintenance(
+            engine, dao_factory=lambda dao_string: FakeDBEngine(compacted_size)
+        )
+        return maintenance, engine, path
+
+    def test_compact_swaps_file(self, tmp_path):
+        maintenance, engine, path = self._maintenance(tmp_path, 1000, 400)
+        report = maintenance.compact()
+        eq_(report.file_size, 1000)
+        eq_(report.free_bytes, 600)
+        is_(report.swapped, True)
+        is_(engine.disposed, True)
+        eq_(os.path.getsize(path), 400)
+        eq_(os.listdir(str(tmp_path)), ["db.accdb"])
+
+    def test_measure_keeps_file(self, tmp_path):
+        maintenance, engine, path = self._maintenance(tmp_path, 1000, 400)
+        report = maintenance.measure()
+        eq_(report.free_bytes, 600)
+        is_(report.swapped, False)
+        eq_(os.path.getsize(path), 1000)
+        eq_(os.listdir(str(tmp_path)), ["db.accdb"])
+
+    def test_policy_threshold(self, tmp_path):
+        maintenance, engine, path = self._maintenance(tmp_path, 1000, 900)
+        policy = threshold_policy(ratio=0.25, min_free_bytes=0)
+        is_(maintenance.compact_if_needed(policy).swapped, False)
+        eq_(os.path.getsize(path), 1000)
+
+        maintenance, engine, path = self._maintenance(tmp_path, 1000, 700)
+        is_(maintenance.compact_if_needed(policy).swapped, True)
+        eq_(os.path.getsize(path), 700)
+
+    def test_database_in_use(self, tmp_path):
+        maintenance, engine, path = self._maintenance(tmp_path, 1000, 400)
+        open(str(tmp_path / "db.laccdb"), "wb").close()
+        assert_raises(DatabaseInUseError, maintenance.compact)
+        eq_(os.path.getsize(path), 1000)
+
+    def _concurrent_writer(self, tmp_path, lock):
+        path = str(tmp_path / "db.accdb")
+        with open(path, "wb") as f:
+            f.write(b"o" * 1000)
+        maintenance = DatabaseMaintenance(
+            FakeEngine(path),
+            dao_factory=lambda dao_string: ConcurrentWriterDBEngine(400, lock),
+        )
+        return maintenance, path
+
+    def test_opened_while_compacting(self, tmp_path):
+        maintenance, path = self._concurrent_writer(tmp_path, lock=True)
+        assert_raises(DatabaseInUseError, maintenance.compact)
+        eq_(os.path.getsize(path), 1001)
+        eq_(sorted(os.listdir(str(tmp_path))), ["db.accdb", "db.laccdb"])
+
+    def test_changed_while_compacting(self, tmp_path):
+        maintenance, path = self._concurrent_writer(tmp_path, lock=False)
+        assert_raises(DatabaseInUseError, maintenance.compact)
+        eq_(os.path.getsize(path), 1001)
+        eq_(os.listdir(str(tmp_path)), ["db.accdb"])
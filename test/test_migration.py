@@ -0,0 +1,112 @@
+import io
+
+import pytest
+from sqlalchemy import Column, Integer, String, exc
+from sqlalchemy.testing import eq_, fixtures
+from sqlalchemy.testing.assertions import assert_raises_message
+
+from sqlalchemy_access import AutoNumber
+
+alembic = pytest.importorskip("alembic")
+
+from alembic.migration import MigrationContext  # noqa: E402
+from alembic.operations import Operations  # noqa: E402
+
+
+class AccessImplTest(fixtures.TestBase):
+    def _op(self):
+        buf = io.StringIO()
+        ctx = MigrationContext.configure(
+            dialect_name="access",
+            opts={"as_sql": True, "output_buffer": buf},
+        )
+        return Operations(ctx), buf
+
+    def _sql(self, buf):
+        return [s.strip() for s in buf.getvalue().split(";") if s.strip()]
+
+    def test_alter_column_type_and_nullable(self):
+        op, buf = self._op()
+        op.alter_column("t", "x", type_=String(20), nullable=False)
+        op.alter_column("t", "x", nullable=True, existing_type=String(20))
+        op.alter_column("t", "x", type_=Integer, existing_nullable=False)
+        eq_(
+            self._sql(buf),
+            [
+                "ALTER TABLE t ALTER COLUMN x VARCHAR(20) NOT NULL",
+                "ALTER TABLE t ALTER COLUMN x VARCHAR(20)",
+                "ALTER TABLE t ALTER COLUMN x INTEGER NOT NULL",
+            ],
+        )
+
+    def test_alter_column_nullable_requires_existing_type(self):
+        op, _ = self._op()
+        assert_raises_message(
+            exc.CompileError,
+            "access requires existing_type",
+            op.alter_column,
+            "t",
+            "x",
+            nullable=False,
+        )
+
+    def test_alter_column_type_requires_existing_nullable(self):
+        op, _ = self._op()
+        assert_raises_message(
+            exc.CompileError,
+            "access requires existing_nullable",
+            op.alter_column,
+            "t",
+            "x",
+            type_=Integer,
+        )
+
+    def test_columns_and_indexes(self):
+        op, buf = self._op()
+        op.add_column("t", Column("y", String(10)))
+        op.create_index("ix_y", "t", ["y"])
+        op.drop_index("ix_y", "t")
+        op.drop_column("t", "y")
+        eq_(
+            self._sql(buf),
+            [
+                "ALTER TABLE t ADD COLUMN y VARCHAR(10) NULL",
+                "CREATE INDEX ix_y ON t (y)",
+                "DROP INDEX ix_y ON t",
+                "ALTER TABLE t DROP COLUMN y",
+            ],
+        )
+
+    def test_rename_is_not_available_offline(self):
+        op, _ = self._op()
+        assert_raises_message(
+            NotImplementedError,
+            "not available in offline mode",
+            op.rename_table,
+            "t",
+            "u",
+        )
+
+    def test_requires_recreate_in_batch(self):
+        op, _ = self._op()
+        impl = op.impl
+
+        class Batch(object):
+            def __init__(self, *ops):
+                self.batch = list(ops)
+
+        eq_(
+            impl.requires_recreate_in_batch(
+                Batch(
+                    ("add_column", ("t", Column("y", Integer)), {}),
+                    ("alter_column", ("t", "x"), {"type_": String(20)}),
+                )
+            ),
+            False,
+        )
+        eq_(
+            impl.requires_recreate_in_batch(
+                Batch(("alter_column", ("t", "id"), {"type_": AutoNumber}))
+            ),
+            True,
+        )
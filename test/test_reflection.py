@@ -0,0 +1,151 @@
+from sqlalchemy import inspect, MetaData, Table
+from sqlalchemy.testing import eq_, fixtures, is_
+
+from ._fakes import (
+    fake_dao,
+    fake_engine,
+    FakeDatabaseFile,
+    FakeIndex,
+    FakeTable,
+)
+
+MAIN = r"C:\data\main.accdb"
+ARCHIVE = r"C:\data\archive.accdb"
+
+
+class ExternalDatabaseReflectionTest(fixtures.TestBase):
+    def setup_test(self):
+        self.main = FakeDatabaseFile(
+            MAIN,
+            [FakeTable("orders", [("id", "COUNTER", 10, False)])],
+        )
+        self.archive = FakeDatabaseFile(
+            ARCHIVE,
+            [
+                FakeTable(
+                    "old_orders",
+                    [
+                        ("id", "INTEGER", 10, False),
+                        ("txt", "VARCHAR", 50, True),
+                    ],
+                    indexes=[
+                        FakeIndex("PrimaryKey", ["id"], primary=True),
+                        FakeIndex("ix_txt", ["txt"], ignore_nulls=True),
+                    ],
+                ),
+                FakeTable("old_view", [], table_type="VIEW"),
+            ],
+            procedures=["old_orders_by_id"],
+        )
+        self.engine = fake_engine(self.main.connect)
+
+    def test_names(self):
+        with fake_dao(self.main, self.archive):
+            insp = inspect(self.engine)
+            eq_(insp.get_table_names(), ["orders"])
+            eq_(insp.get_table_names(access_database=ARCHIVE), ["old_orders"])
+            eq_(
+                insp.get_view_names(access_database=ARCHIVE),
+                ["old_view", "old_orders_by_id"],
+            )
+            is_(insp.has_table("old_orders"), False)
+            is_(insp.has_table("old_orders", access_database=ARCHIVE), True)
+        # each reflection call used its own connection to the other file
+        eq_(len(self.archive.connections), 3)
+        assert all(conn.closed for conn in self.archive.connections)
+
+    def test_connection_string(self):
+        with fake_dao(self.main, self.archive):
+            with self.engine.connect() as conn:
+                with self.engine.dialect._get_pyodbc_connection(
+                    conn
+                ) as pyodbc_cnxn:
+                    is_(pyodbc_cnxn, conn.connection)
+                eq_(
+                    self.engine.dialect._get_odbc_connection_string(
+                        conn.connection.cursor(), ARCHIVE
+                    ),
+                    "DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
+                    "DBQ=C:\\data\\archive.accdb;ExtendedAnsiSQL=1;",
+                )
+
+    def test_reflect_table(self):
+        with fake_dao(self.main, self.archive) as db_engine:
+            with self.engine.connect() as conn:
+                old_orders = Table(
+                    "old_orders",
+                    MetaData(),
+                    autoload_with=conn,
+                    access_database=ARCHIVE,
+                )
+        eq_(list(old_orders.c.keys()), ["id", "txt"])
+        eq_([col.name for col in old_orders.primary_key], ["id"])
+        eq_(
+            [
+                (idx.name, idx.dialect_options["access"]["with"])
+                for idx in old_orders.indexes
+            ],
+            [("ix_txt", "IGNORE NULL")],
+        )
+        eq_(old_orders.dialect_options["access"]["database"], ARCHIVE)
+        # DAO opened the other file, without the main file's password
+        eq_(
+            {opened[0] for opened in db_engine.opened},
+            {ARCHIVE},
+        )
+        eq_({opened[3] for opened in db_engine.opened}, {"MS Access;PWD="})
+
+
+class TableRowCountsTest(fixtures.TestBase):
+    def setup_test(self):
+        self.main = FakeDatabaseFile(
+            MAIN,
+            [
+                FakeTable("orders", [], record_count=12),
+                FakeTable("customers", [], record_count=3),
+                FakeTable(
+                    "linked",
+                    [],
+                    record_count=-1,
+                    connect=";DATABASE=C:\\data\\other.accdb",
+                ),
+            ],
+        )
+        self.engine = fake_engine(self.main.connect)
+
+    def test_counts(self):
+        with fake_dao(self.main):
+            with self.engine.connect() as conn:
+                conn.connection.dbapi_connection.results[
+                    "SELECT count(*) AS count_1 \nFROM linked"
+                ] = ((("count_1", int, None, 10, 10, 0, False),), [(7,)])
+                eq_(
+                    inspect(conn).get_table_row_counts(),
+                    {"orders": 12, "customers": 3, "linked": 7},
+                )
+        # the DAO Database was closed, also after counting the linked table
+        eq_(len(self.main.dao_databases), 1)
+        is_(self.main.dao_databases[0].closed, True)
+
+    def test_table_names(self):
+        with fake_dao(self.main):
+            insp = inspect(self.engine)
+            eq_(insp.get_table_row_counts(["customers"]), {"customers": 3})
+            eq_(insp.get_table_row_count("orders"), 12)
+            eq_(insp.get_table_row_counts([]), {})
+        # local tables are not counted with SELECT COUNT(*)
+        eq_(self.main.connections[0].executed, [])
+
+    def test_cached_by_inspector(self):
+        with fake_dao(self.main) as db_engine:
+            insp = inspect(self.engine)
+            eq_(insp.get_table_row_counts(["orders"]), {"orders": 12})
+            self.main.tables["orders"].record_count = 13
+            eq_(insp.get_table_row_counts(["orders"]), {"orders": 12})
+            eq_(len(db_engine.opened), 1)
+            # a new inspector sees the new count
+            eq_(
+                inspect(self.engine).get_table_row_counts(["orders"]),
+                {"orders": 13},
+            )
+            eq_(len(db_engine.opened), 2)
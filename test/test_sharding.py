@@ -0,0 +1,140 @@
+import threading
+import time
+from unittest import mock
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    literal,
+    select,
+)
+from sqlalchemy.testing import eq_, fixtures
+from sqlalchemy.testing.assertions import AssertsCompiledSQL, assert_raises
+
+from sqlalchemy_access import sharding
+from sqlalchemy_access.sharding import (
+    HashStrategy,
+    RangeStrategy,
+    ShardedTable,
+)
+
+
+def _table():
+    return Table(
+        "orders",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("amount", Integer),
+    )
+
+
+class StrategyTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    keys = [-7, -4, -3, -1, 0, 1, 2, 3, 5, 999999, 1000000, 1000001]
+
+    def _assert_criteria_agree(self, strategy):
+        # SQLite's % has the same sign rules as Jet's MOD
+        with create_engine("sqlite://").connect() as conn:
+            for key in self.keys:
+                matches = [
+                    shard
+                    for shard in range(strategy.shard_count)
+                    if conn.scalar(
+                        select(strategy.criteria(literal(key, Integer), shard))
+                    )
+                ]
+                eq_(matches, [strategy.shard_for(key)], "key %d" % key)
+
+    def test_hash_criteria_agree_with_shard_for(self):
+        self._assert_criteria_agree(HashStrategy("id", 3))
+
+    def test_range_criteria_agree_with_shard_for(self):
+        self._assert_criteria_agree(RangeStrategy("id", [0, 1000000]))
+
+    def test_hash_negative_key(self):
+        eq_(HashStrategy("id", 2).shard_for(-3), 1)
+
+    def test_hash_rejects_non_integer_keys(self):
+        strategy = HashStrategy("id", 2)
+        assert_raises(ValueError, strategy.shard_for, 2.5)
+        assert_raises(ValueError, strategy.shard_for, "3")
+
+    def test_hash_criteria_sql(self):
+        self.assert_compile(
+            HashStrategy("id", 2).criteria(_table().c.id, 1),
+            "abs(orders.id) MOD :abs_1 = :param_1",
+            checkparams={"abs_1": 2, "param_1": 1},
+        )
+
+
+class UnionAllTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "access"
+
+    def _sharded(self):
+        return ShardedTable(
+            None,
+            _table(),
+            [r"C:\data\orders_0.accdb", r"C:\data\orders_1.accdb"],
+            HashStrategy("id", 2),
+        )
+
+    def test_union_all(self):
+        self.assert_compile(
+            self._sharded().union_all(),
+            "SELECT orders.id, orders.amount "
+            "FROM [;DATABASE=C:\\data\\orders_0.accdb].orders "
+            "UNION ALL SELECT orders.id, orders.amount "
+            "FROM [;DATABASE=C:\\data\\orders_1.accdb].orders",
+        )
+
+    def test_union_all_pushes_down_statement(self):
+        self.assert_compile(
+            self._sharded().union_all(
+                lambda tbl: select(tbl.c.id).where(tbl.c.amount > 100)
+            ),
+            "SELECT orders.id "
+            "FROM [;DATABASE=C:\\data\\orders_0.accdb].orders "
+            "WHERE orders.amount > :amount_1 "
+            "UNION ALL SELECT orders.id "
+            "FROM [;DATABASE=C:\\data\\orders_1.accdb].orders "
+            "WHERE orders.amount > :amount_2",
+        )
+
+
+class ShardEngineTest(fixtures.TestBase):
+    def test_engines_are_created_once_across_threads(self):
+        sharded = ShardedTable(
+            None,
+            _table(),
+            [r"C:\data\orders_0.accdb", r"C:\data\orders_1.accdb"],
+            HashStrategy("id", 2),
+        )
+        created = []
+
+        def create_database_engine(connection_string):
+            # widen the window between the check and the creation
+            time.sleep(0.01)
+            created.append(connection_string)
+            return mock.Mock()
+
+        barrier = threading.Barrier(8)
+
+        def get_engine():
+            barrier.wait()
+            return sharded.shard_engine(0)
+
+        with mock.patch.object(
+            sharding, "create_database_engine", create_database_engine
+        ), mock.patch.object(
+            sharded, "_connection_string", lambda path: "DBQ=%s;" % path
+        ):
+            threads = [threading.Thread(target=get_engine) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        eq_(created, ["DBQ=C:\\data\\orders_0.accdb;"])
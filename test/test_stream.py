@@ -0,0 +1,180 @@
+from sqlalchemy import Column, exc, Integer, MetaData, Table
+from sqlalchemy.testing import eq_, fixtures, is_
+from sqlalchemy.testing.assertions import assert_raises
+
+from sqlalchemy_access.base import (
+    AccessDialect,
+    dbMemo,
+    dbOpenDynaset,
+    dbOpenSnapshot,
+    LongText,
+    OleObject,
+)
+
+dbLongBinary = 11
+
+
+class FakeField(object):
+    def __init__(self, field_type, value):
+        self.Type = field_type
+        self.Value = value
+
+    def FieldSize(self):
+        return len(self.Value)
+
+    def GetChunk(self, offset, size):
+        return self.Value[offset : offset + size]
+
+    def AppendChunk(self, data):
+        if self.Value is None:
+            self.Value = data
+        else:
+            self.Value += data
+
+
+class FakeRecordset(object):
+    def __init__(self, database, field, rows):
+        self.database = database
+        self.field = field
+        self.EOF = not rows
+        self.closed = False
+
+    def Fields(self, name):
+        return self.field
+
+    def Edit(self):
+        self.saved_value = self.field.Value
+
+    def Update(self):
+        self.database.stored = self.field.Value
+
+    def CancelUpdate(self):
+        self.field.Value = self.saved_value
+        self.database.cancelled = True
+
+    def Close(self):
+        self.closed = True
+
+
+class FakeDatabase(object):
+    """A DAO Database with a single row, whose ``notes`` value is ``value``"""
+
+    def __init__(self, value, rows=1):
+        self.field = FakeField(
+            dbMemo if isinstance(value, str) else dbLongBinary, value
+        )
+        self.rows = rows
+        self.stored = None
+        self.cancelled = False
+        self.closed = False
+        self.recordsets = []
+
+    def OpenRecordset(self, sql, recordset_type):
+        self.recordsets.append((sql, recordset_type))
+        return FakeRecordset(self, self.field, self.rows)
+
+    def Close(self):
+        self.closed = True
+
+
+class FakeDAODialect(AccessDialect):
+    def __init__(self, database, **kw):
+        super(FakeDAODialect, self).__init__(**kw)
+        self.database = database
+        self.opened = []
+
+    def _get_dao_database(self, connection, table_name, **kw):
+        self.opened.append((table_name, kw))
+        return self.database
+
+
+class FakeConnection(object):
+    def __init__(self, database):
+        self.dialect = FakeDAODialect(database)
+
+
+class ChunkStreamTest(fixtures.TestBase):
+    def _table(self, type_, **kw):
+        return Table(
+            "docs",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("notes", type_),
+            **kw
+        )
+
+    def test_read_in_chunks(self):
+        database = FakeDatabase("abcdefg")
+        conn = FakeConnection(database)
+        docs = self._table(LongText)
+        with LongText.open_stream(
+            conn, docs.c.notes, docs.c.id == 1, chunk_size=3
+        ) as stream:
+            eq_(stream.read(3), "abc")
+            eq_(stream.read(), "defg")
+            eq_(stream.read(), "")
+        eq_(
+            database.recordsets,
+            [
+                (
+                    "SELECT docs.notes \nFROM docs \nWHERE docs.id = 1",
+                    dbOpenSnapshot,
+                )
+            ],
+        )
+        eq_(conn.dialect.opened[0][1]["read_only"], True)
+        is_(database.closed, True)
+
+    def test_write_replaces_value(self):
+        database = FakeDatabase(b"old value")
+        conn = FakeConnection(database)
+        docs = self._table(OleObject)
+        with OleObject.open_stream(
+            conn, docs.c.notes, docs.c.id == 1, mode="w"
+        ) as stream:
+            stream.write(b"new ")
+            stream.write(b"value")
+        eq_(database.stored, b"new value")
+        eq_(database.recordsets[0][1], dbOpenDynaset)
+        eq_(conn.dialect.opened[0][1]["read_only"], False)
+        is_(database.closed, True)
+
+    def test_write_aborted_by_exception(self):
+        database = FakeDatabase(b"old value")
+        conn = FakeConnection(database)
+        docs = self._table(OleObject)
+
+        def write():
+            with OleObject.open_stream(
+                conn, docs.c.notes, docs.c.id == 1, mode="w"
+            ) as stream:
+                stream.write(b"partial")
+                raise ValueError("source failed")
+
+        assert_raises(ValueError, write)
+        is_(database.stored, None)
+        is_(database.cancelled, True)
+        eq_(database.field.Value, b"old value")
+        is_(database.closed, True)
+
+    def test_no_row(self):
+        database = FakeDatabase("x", rows=0)
+        conn = FakeConnection(database)
+        docs = self._table(LongText)
+        assert_raises(
+            exc.NoResultFound,
+            LongText.open_stream,
+            conn,
+            docs.c.notes,
+            docs.c.id == 1,
+        )
+        is_(database.closed, True)
+
+    def test_external_table_opens_its_database(self):
+        conn = FakeConnection(FakeDatabase("x"))
+        docs = self._table(LongText, access_database=r"C:\data\docs.accdb")
+        LongText.open_stream(conn, docs.c.notes, docs.c.id == 1).close()
+        eq_(
+            conn.dialect.opened[0][1]["access_database"],
+            r"C:\data\docs.accdb",
+        )